@@ -12,8 +12,12 @@ These interfaces support:
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass
@@ -24,6 +28,20 @@ class EmbeddingResult:
     dimension: int
     model_name: str
 
+    @cached_property
+    def array(self) -> "np.ndarray":
+        """Vector as a float64 NumPy array, converted once on first access"""
+        import numpy as np  # Only needed by similarity calculations
+
+        return np.asarray(self.vector, dtype=np.float64)
+
+    @cached_property
+    def norm(self) -> float:
+        """Euclidean magnitude of the vector, computed once on first access"""
+        import numpy as np
+
+        return float(np.linalg.norm(self.array))
+
 
 @dataclass
 class SimilarityResult:
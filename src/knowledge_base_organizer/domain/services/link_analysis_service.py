@@ -128,6 +128,9 @@ class LinkAnalysisService:
         self.japanese_enabled = True
         # Initialize keyword extraction manager
         self.keyword_manager = KeywordExtractionManager(config_dir)
+        # Last enhanced target lookup and the registry fingerprint it was built from
+        self._target_lookup: list[dict[str, Any]] | None = None
+        self._target_lookup_key: tuple[Any, ...] | None = None
 
     def extract_exclusion_zones(self, content: str) -> list[TextRange]:
         """Extract areas where auto-linking should be avoided.
@@ -365,7 +368,7 @@ class LinkAnalysisService:
         lines = content.split("\n")
 
         # Build enhanced lookup with Japanese variations
-        enhanced_targets = self._build_enhanced_target_lookup(file_registry)
+        enhanced_targets = self._get_enhanced_target_lookup(file_registry)
 
         # Track positions to avoid duplicates
         seen_positions = set()
@@ -617,6 +620,27 @@ class LinkAnalysisService:
 
         return "\n".join(body_lines)
 
+    def _get_enhanced_target_lookup(
+        self, file_registry: dict[str, MarkdownFile]
+    ) -> list[dict[str, Any]]:
+        """Get the enhanced target lookup, rebuilding it only when targets change.
+
+        Callers such as auto-link generation pass the same registry for every
+        file in a vault, so the lookup is reused until a title or alias changes.
+        """
+        cache_key = (
+            self.japanese_enabled,
+            tuple(
+                (file_id, file.frontmatter.title, tuple(file.frontmatter.aliases))
+                for file_id, file in file_registry.items()
+            ),
+        )
+        if self._target_lookup is None or cache_key != self._target_lookup_key:
+            self._target_lookup = self._build_enhanced_target_lookup(file_registry)
+            self._target_lookup_key = cache_key
+
+        return self._target_lookup
+
     def _build_enhanced_target_lookup(
         self, file_registry: dict[str, MarkdownFile]
     ) -> list[dict[str, Any]]:
@@ -1,9 +1,11 @@
 """File repository for loading and saving markdown files."""
 
 import fnmatch
+import os
 import re
+from collections.abc import Iterator
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePath
 from typing import Any
 
 import yaml
@@ -16,6 +18,14 @@ from knowledge_base_organizer.domain.models import (
 )
 from knowledge_base_organizer.infrastructure.config import ProcessingConfig
 
+try:
+    import hyperscan  # type: ignore[import-not-found]
+except ImportError:  # Optional DFA matcher for large exclude pattern sets
+    hyperscan = None
+
+# Below this many exclude patterns the combined `re` alternation is fast enough
+HYPERSCAN_MIN_PATTERNS = 8
+
 
 class FileRepository:
     """Repository for file operations."""
@@ -23,40 +33,178 @@ class FileRepository:
     def __init__(self, config: ProcessingConfig) -> None:
         """Initialize file repository with configuration."""
         self.config = config
+        self._exclude_re = self._compile_exclude_patterns(config.exclude_patterns)
+        self._exclude_db = self._compile_exclude_database(config.exclude_patterns)
+        # Directory names from **/NAME/** patterns are pruned during the walk
+        self._excluded_dirs = frozenset(
+            pattern[3:-3]
+            for pattern in config.exclude_patterns
+            if pattern.startswith("**/")
+            and pattern.endswith("/**")
+            and "/" not in pattern[3:-3]
+        )
+
+    @staticmethod
+    def _exclude_pattern_regexes(patterns: list[str]) -> list[str]:
+        """Translate exclude patterns into anchored-at-end regex strings.
+
+        ``**/dirname/**`` patterns match the directory name at any depth,
+        including the vault root; all other patterns use fnmatch semantics.
+        """
+        regexes = []
+        for pattern in patterns:
+            if pattern.startswith("**/") and pattern.endswith("/**"):
+                dir_name = re.escape(pattern[3:-3])  # Remove **/ and /**
+                regexes.append(rf"(?:.*/)?{dir_name}(?:/.*)?\Z")
+            else:
+                regexes.append(fnmatch.translate(pattern))
+        return regexes
+
+    @classmethod
+    def _compile_exclude_patterns(cls, patterns: list[str]) -> re.Pattern[str] | None:
+        """Combine exclude patterns into a single regex alternation."""
+        regexes = cls._exclude_pattern_regexes(patterns)
+        if not regexes:
+            return None
+        return re.compile("|".join(regexes), re.DOTALL)
+
+    @classmethod
+    def _compile_exclude_database(cls, patterns: list[str]) -> Any | None:
+        """Compile exclude patterns into a hyperscan database when worthwhile.
+
+        Returns None if hyperscan is not installed, the pattern set is small,
+        or a pattern uses syntax hyperscan cannot compile.
+        """
+        if hyperscan is None or len(patterns) < HYPERSCAN_MIN_PATTERNS:
+            return None
+
+        # Hyperscan has no atomic groups (used by fnmatch) and spells the
+        # end-of-input anchor \z; `re.match` semantics need a leading ^
+        expressions = [
+            ("^" + regex.replace("(?>", "(?:").removesuffix(r"\Z") + r"\z").encode()
+            for regex in cls._exclude_pattern_regexes(patterns)
+        ]
+        flags = (
+            hyperscan.HS_FLAG_DOTALL
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_UTF8
+        )
+
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[flags] * len(expressions),
+            )
+        except hyperscan.error as e:
+            print(f"Warning: Falling back to regex exclude matching: {e}")
+            return None
+        return database
+
+    def _is_excluded(self, relative_str: str) -> bool:
+        """Check a vault-relative POSIX path against all exclude patterns."""
+        if self._exclude_db is not None:
+            try:
+                data = relative_str.encode("utf-8")
+            except UnicodeEncodeError:
+                # Undecodable filename; hyperscan needs valid UTF-8 input
+                pass
+            else:
+                try:
+                    # Returning True from the handler stops at the first match
+                    self._exclude_db.scan(data, match_event_handler=lambda *_: True)
+                except hyperscan.ScanTerminated:
+                    return True
+                return False
+
+        return self._exclude_re is not None and bool(
+            self._exclude_re.match(relative_str)
+        )
 
     def load_vault(self, vault_path: Path) -> list[MarkdownFile]:
         """Load all markdown files matching include/exclude patterns."""
+        return list(self.iter_vault(vault_path))
+
+    def iter_vault(self, vault_path: Path) -> Iterator[MarkdownFile]:
+        """Yield markdown files matching include/exclude patterns one at a time.
+
+        Files are parsed lazily as the vault is walked, so callers that process
+        one file at a time never hold the whole vault in memory.
+
+        Raises:
+            ValueError: If the vault path does not exist
+        """
+        # Validate eagerly so the error surfaces at call time, not first next()
         if not vault_path.exists():
             raise ValueError(f"Vault path does not exist: {vault_path}")
 
-        files = []
-        for pattern in self.config.include_patterns:
-            for file_path in vault_path.rglob(pattern):
-                if self._should_include_file(file_path, vault_path):
-                    try:
-                        markdown_file = self.load_file(file_path)
-                        files.append(markdown_file)
-                    except (ValueError, yaml.YAMLError, ValidationError) as e:
-                        # Log error and continue with other files
-                        print(f"Warning: Failed to load {file_path}: {e}")
-                        continue
+        return self._iter_vault_files(vault_path)
+
+    def _iter_vault_files(self, vault_path: Path) -> Iterator[MarkdownFile]:
+        """Walk the vault and yield each successfully loaded markdown file."""
+        # Computed once per walk; relative paths become a plain string slice
+        vault_prefix = self._vault_prefix(vault_path)
+        # Same semantics as vault_path.rglob(pattern) for each include pattern
+        include_globs = [f"**/{pattern}" for pattern in self.config.include_patterns]
+
+        for file_path in self._walk_vault(vault_path):
+            relative_path = PurePath(
+                self._relative_path_str(file_path, vault_path, vault_prefix)
+            )
+            if not any(relative_path.full_match(glob) for glob in include_globs):
+                continue
+
+            if self._should_include_file(
+                file_path, vault_path, vault_prefix=vault_prefix
+            ):
+                try:
+                    yield self.load_file(file_path)
+                except (ValueError, yaml.YAMLError, ValidationError) as e:
+                    # Log error and continue with other files
+                    print(f"Warning: Failed to load {file_path}: {e}")
+                    continue
 
-        return files
+    def _walk_vault(self, vault_path: Path) -> Iterator[Path]:
+        """Yield every file below the vault, skipping excluded directories.
+
+        Directories named by ``**/NAME/**`` exclude patterns are pruned before
+        descending, so their contents are never listed at all.
+        """
+        for dirpath, dirnames, filenames in os.walk(vault_path):
+            dirnames[:] = [d for d in dirnames if d not in self._excluded_dirs]
+            directory = Path(dirpath)
+            for filename in filenames:
+                yield directory / filename
 
     def load_file(self, file_path: Path) -> MarkdownFile:
         """Load a single markdown file."""
-        if not file_path.exists():
-            raise ValueError(f"File does not exist: {file_path}")
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError as e:
+            raise ValueError(f"File does not exist: {file_path}") from e
+
+        # Cheap filename check first: 14-digit timestamp stems are Obsidian IDs
+        stem = file_path.stem
+        stem_file_id = (
+            stem if stem.isdigit() and len(stem) == OBSIDIAN_ID_LENGTH else None
+        )
+
+        if file_size == 0:
+            # Empty file: nothing to read, parse, or extract links from
+            return MarkdownFile(
+                path=file_path,
+                file_id=stem_file_id,
+                frontmatter=Frontmatter(),
+                content="",
+            )
 
         content = file_path.read_text(encoding="utf-8")
         frontmatter, body_content = self._parse_frontmatter(content)
 
-        # Extract file ID
-        file_id = None
-        if frontmatter.id:
-            file_id = frontmatter.id
-        elif file_path.stem.isdigit() and len(file_path.stem) == OBSIDIAN_ID_LENGTH:
-            file_id = file_path.stem
+        # Frontmatter ID takes precedence over the filename-derived ID
+        file_id = frontmatter.id or stem_file_id
 
         markdown_file = MarkdownFile(
             path=file_path,
@@ -110,7 +258,15 @@ class FileRepository:
         backup_content = backup_path.read_text(encoding="utf-8")
         file_path.write_text(backup_content, encoding="utf-8")
 
-    def _should_include_file(self, file_path: Path, vault_path: Path) -> bool:
+    @staticmethod
+    def _vault_prefix(vault_path: Path) -> str:
+        """Get the string prefix shared by all paths below the vault root."""
+        prefix = str(vault_path)
+        return prefix if prefix.endswith(os.sep) else prefix + os.sep
+
+    def _should_include_file(
+        self, file_path: Path, vault_path: Path, *, vault_prefix: str | None = None
+    ) -> bool:
         """Check if file should be included based on exclude patterns."""
         # Skip directories - only process files
         if not file_path.is_file():
@@ -120,23 +276,29 @@ class FileRepository:
         if file_path.suffix.lower() != ".md":
             return False
 
-        relative_path = file_path.relative_to(vault_path)
-        relative_str = str(relative_path)
-        path_parts = relative_path.parts
-
-        # Check against each exclude pattern
-        for exclude_pattern in self.config.exclude_patterns:
-            # Handle **/dirname/** patterns by checking path parts
-            if exclude_pattern.startswith("**/") and exclude_pattern.endswith("/**"):
-                # Extract directory name from **/dirname/** pattern
-                dir_name = exclude_pattern[3:-3]  # Remove **/ and /**
-                if dir_name in path_parts:
-                    return False
-            # Handle other patterns with fnmatch
-            elif fnmatch.fnmatch(relative_str, exclude_pattern):
-                return False
+        if self._exclude_re is None:
+            return True
 
-        return True
+        if vault_prefix is None:
+            vault_prefix = self._vault_prefix(vault_path)
+
+        # All exclude patterns are checked with a single match call
+        relative_str = self._relative_path_str(file_path, vault_path, vault_prefix)
+        return not self._is_excluded(relative_str)
+
+    @staticmethod
+    def _relative_path_str(file_path: Path, vault_path: Path, vault_prefix: str) -> str:
+        """Get the vault-relative POSIX path of a file below the vault."""
+        # Slice off the vault root instead of walking Path.parts
+        path_str = str(file_path)
+        if path_str.startswith(vault_prefix):
+            relative_str = path_str[len(vault_prefix) :]
+            if os.sep != "/":
+                relative_str = relative_str.replace(os.sep, "/")
+            return relative_str
+
+        # e.g. a relative vault such as "." whose children lack the prefix
+        return file_path.relative_to(vault_path).as_posix()
 
     def _parse_frontmatter(self, content: str) -> tuple[Frontmatter, str]:
         """Parse frontmatter from markdown content with enhanced error handling."""
@@ -7,23 +7,28 @@ OpenAI-compatible APIs.
 """
 
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
 
 
-class LLMProviderConfig(BaseModel):
-    """Configuration for a specific LLM provider."""
+@dataclass(slots=True, frozen=True)
+class LLMProviderConfig:
+    """Configuration for a specific LLM provider.
+
+    A plain dataclass keeps per-instance construction cheap; fields are still
+    validated by pydantic when loaded through ``LLMConfig.providers``.
+    """
 
     base_url: str
     model_name: str
     timeout: int = 120
     api_format: str = "ollama"  # "ollama", "openai", etc.
     api_key: str | None = None
-    options: dict[str, Any] = Field(default_factory=dict)
-    alternative_models: list[str] = Field(default_factory=list)
+    options: dict[str, Any] = field(default_factory=dict)
+    alternative_models: list[str] = field(default_factory=list)
 
 
 class LLMFeatureConfig(BaseModel):
@@ -98,6 +103,17 @@ class LLMConfig(BaseModel):
     logging: LLMLoggingConfig = Field(default_factory=LLMLoggingConfig)
 
 
+# Environment variables that override config values, with their key paths
+_ENV_OVERRIDES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("LLM_PROVIDER", ("default_provider",)),
+    ("OLLAMA_BASE_URL", ("providers", "ollama", "base_url")),
+    ("OLLAMA_MODEL", ("providers", "ollama", "model_name")),
+    ("LM_STUDIO_BASE_URL", ("providers", "lm_studio", "base_url")),
+    ("OPENAI_API_KEY", ("providers", "openai_compatible", "api_key")),
+    ("OPENAI_BASE_URL", ("providers", "openai_compatible", "base_url")),
+)
+
+
 class LLMConfigManager:
     """Manager for LLM configuration loading and validation."""
 
@@ -110,6 +126,7 @@ class LLMConfigManager:
         """
         self.config_path = config_path
         self._config: LLMConfig | None = None
+        self._cache_key: tuple[Path, int, int] | None = None
 
     def load_config(self) -> LLMConfig:
         """
@@ -118,7 +135,9 @@ class LLMConfigManager:
         Returns:
             LLMConfig object with loaded configuration
         """
-        if self._config is not None:
+        # Reuse the cached config unless the config file has changed on disk
+        cache_key = self._get_config_fingerprint()
+        if self._config is not None and cache_key == self._cache_key:
             return self._config
 
         # Try to load from various sources
@@ -129,18 +148,35 @@ class LLMConfigManager:
 
         # Validate and create config object
         self._config = LLMConfig(**config_data)
+        self._cache_key = cache_key
 
         return self._config
 
+    def _get_config_fingerprint(self) -> tuple[Path, int, int] | None:
+        """Get (path, mtime_ns, size) of the first existing config file."""
+        for config_path in self._get_config_paths():
+            try:
+                stat = config_path.stat()
+            except OSError:
+                continue
+            return (config_path, stat.st_mtime_ns, stat.st_size)
+
+        # No config file found; the default configuration is used
+        return None
+
     def _load_config_data(self) -> dict[str, Any]:
         """Load configuration data from file."""
         config_paths = self._get_config_paths()
 
         for config_path in config_paths:
             if config_path.exists():
+                import yaml  # Imported lazily; only needed when a config file exists
+
+                # Prefer libyaml's C implementation; fall back to pure Python
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
                 try:
                     with Path(config_path).open(encoding="utf-8") as f:
-                        return yaml.safe_load(f) or {}
+                        return yaml.load(f, Loader=loader) or {}  # nosec B506
                 except Exception as e:
                     print(f"Warning: Failed to load config from {config_path}: {e}")
                     continue
@@ -177,55 +213,16 @@ class LLMConfigManager:
 
     def _apply_env_overrides(self, config_data: dict[str, Any]) -> dict[str, Any]:
         """Apply environment variable overrides to configuration."""
-        # Override default provider
-        if os.getenv("LLM_PROVIDER"):
-            config_data["default_provider"] = os.getenv("LLM_PROVIDER")
-
-        # Override Ollama settings
-        if os.getenv("OLLAMA_BASE_URL"):
-            if "providers" not in config_data:
-                config_data["providers"] = {}
-            if "ollama" not in config_data["providers"]:
-                config_data["providers"]["ollama"] = {}
-            config_data["providers"]["ollama"]["base_url"] = os.getenv(
-                "OLLAMA_BASE_URL"
-            )
+        for env_key, key_path in _ENV_OVERRIDES:
+            value = os.environ.get(env_key)
+            if not value:
+                continue
 
-        if os.getenv("OLLAMA_MODEL"):
-            if "providers" not in config_data:
-                config_data["providers"] = {}
-            if "ollama" not in config_data["providers"]:
-                config_data["providers"]["ollama"] = {}
-            config_data["providers"]["ollama"]["model_name"] = os.getenv("OLLAMA_MODEL")
-
-        # Override LM Studio settings
-        if os.getenv("LM_STUDIO_BASE_URL"):
-            if "providers" not in config_data:
-                config_data["providers"] = {}
-            if "lm_studio" not in config_data["providers"]:
-                config_data["providers"]["lm_studio"] = {}
-            config_data["providers"]["lm_studio"]["base_url"] = os.getenv(
-                "LM_STUDIO_BASE_URL"
-            )
-
-        # Override OpenAI API settings
-        if os.getenv("OPENAI_API_KEY"):
-            if "providers" not in config_data:
-                config_data["providers"] = {}
-            if "openai_compatible" not in config_data["providers"]:
-                config_data["providers"]["openai_compatible"] = {}
-            config_data["providers"]["openai_compatible"]["api_key"] = os.getenv(
-                "OPENAI_API_KEY"
-            )
-
-        if os.getenv("OPENAI_BASE_URL"):
-            if "providers" not in config_data:
-                config_data["providers"] = {}
-            if "openai_compatible" not in config_data["providers"]:
-                config_data["providers"]["openai_compatible"] = {}
-            config_data["providers"]["openai_compatible"]["base_url"] = os.getenv(
-                "OPENAI_BASE_URL"
-            )
+            # Walk/create intermediate dicts, then set the leaf value
+            target = config_data
+            for key in key_path[:-1]:
+                target = target.setdefault(key, {})
+            target[key_path[-1]] = value
 
         return config_data
 
@@ -335,9 +332,18 @@ class LLMConfigManager:
             },
         }
 
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with Path(output_path).open("w", encoding="utf-8") as f:
-            yaml.dump(template_config, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(
+                template_config,
+                f,
+                Dumper=dumper,
+                default_flow_style=False,
+                allow_unicode=True,
+            )
 
         print(f"Created LLM configuration template at: {output_path}")
 
@@ -7,6 +7,7 @@ LM Studio, and OpenAI-compatible APIs.
 """
 
 import logging
+from dataclasses import replace
 from pathlib import Path
 
 from knowledge_base_organizer.domain.services.ai_services import LLMService
@@ -49,9 +50,9 @@ class LLMServiceFactory:
         # Get provider configuration
         provider_config = self.config_manager.get_provider_config(provider_name)
 
-        # Override model name if specified
+        # Override model name if specified (copy, so cached config is untouched)
         if model_name:
-            provider_config.model_name = model_name
+            provider_config = replace(provider_config, model_name=model_name)
 
         # Prepare service arguments
         service_kwargs = {
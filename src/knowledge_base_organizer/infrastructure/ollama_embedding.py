@@ -14,6 +14,7 @@ import json
 import logging
 from typing import Any
 
+import numpy as np
 import requests
 
 from knowledge_base_organizer.domain.services.ai_services import (
@@ -155,6 +156,54 @@ class OllamaEmbeddingService(EmbeddingService):
         except (KeyError, json.JSONDecodeError) as e:
             raise EmbeddingError(f"Invalid response from Ollama: {e}") from e
 
+    def create_embeddings(self, texts: list[str]) -> list[EmbeddingResult]:
+        """
+        Generate vector embeddings for several texts in one Ollama request.
+
+        Args:
+            texts: Input texts to embed
+
+        Returns:
+            EmbeddingResults in the same order as the input texts
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        if any(not text.strip() for text in texts):
+            raise EmbeddingError("Cannot create embedding for empty text")
+
+        try:
+            # Call Ollama batch embed API
+            response = requests.post(
+                f"{self.base_url}/api/embed",
+                json={
+                    "model": self.model_name,
+                    "input": texts,
+                },
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            embedding_vectors = data.get("embeddings")
+
+            if not embedding_vectors or len(embedding_vectors) != len(texts):
+                raise EmbeddingError("No embedding vectors returned from Ollama")
+
+            return [
+                EmbeddingResult(
+                    vector=vector,
+                    dimension=len(vector),
+                    model_name=self.model_name,
+                )
+                for vector in embedding_vectors
+            ]
+
+        except requests.exceptions.RequestException as e:
+            raise EmbeddingError(f"Failed to generate embeddings: {e}") from e
+        except (KeyError, json.JSONDecodeError) as e:
+            raise EmbeddingError(f"Invalid response from Ollama: {e}") from e
+
     def calculate_similarity(self, text1: str, text2: str) -> SimilarityResult:
         """
         Calculate semantic similarity between two texts using cosine similarity.
@@ -167,14 +216,11 @@ class OllamaEmbeddingService(EmbeddingService):
             SimilarityResult with score and confidence
         """
         try:
-            # Generate embeddings for both texts
-            embedding1 = self.create_embedding(text1)
-            embedding2 = self.create_embedding(text2)
+            # Generate embeddings for both texts in a single request
+            embedding1, embedding2 = self.create_embeddings([text1, text2])
 
             # Calculate cosine similarity
-            similarity_score = self._cosine_similarity(
-                embedding1.vector, embedding2.vector
-            )
+            similarity_score = self._cosine_similarity(embedding1, embedding2)
 
             # Determine confidence based on vector dimensions and similarity
             confidence = self._calculate_confidence(
@@ -196,32 +242,41 @@ class OllamaEmbeddingService(EmbeddingService):
         except Exception as e:
             raise EmbeddingError(f"Failed to calculate similarity: {e}") from e
 
-    def _cosine_similarity(self, vector1: list[float], vector2: list[float]) -> float:
+    def _cosine_similarity(
+        self,
+        vector1: list[float] | EmbeddingResult,
+        vector2: list[float] | EmbeddingResult,
+    ) -> float:
         """
         Calculate cosine similarity between two vectors.
 
         Args:
-            vector1: First vector
-            vector2: Second vector
+            vector1: First vector, or an embedding whose cached array is reused
+            vector2: Second vector, or an embedding whose cached array is reused
 
         Returns:
             Cosine similarity score between -1 and 1
         """
-        if len(vector1) != len(vector2):
-            raise EmbeddingError("Vectors must have the same dimension")
+        array1, magnitude1 = self._as_array(vector1)
+        array2, magnitude2 = self._as_array(vector2)
 
-        # Calculate dot product
-        dot_product: float = sum(a * b for a, b in zip(vector1, vector2, strict=False))
-
-        # Calculate magnitudes
-        magnitude1: float = sum(a * a for a in vector1) ** 0.5
-        magnitude2: float = sum(b * b for b in vector2) ** 0.5
+        if len(array1) != len(array2):
+            raise EmbeddingError("Vectors must have the same dimension")
 
         # Avoid division by zero
         if magnitude1 == 0 or magnitude2 == 0:
             return 0.0
 
-        return float(dot_product / (magnitude1 * magnitude2))
+        return float(np.dot(array1, array2) / (magnitude1 * magnitude2))
+
+    @staticmethod
+    def _as_array(vector: list[float] | EmbeddingResult) -> tuple[np.ndarray, float]:
+        """Get a vector as a NumPy array together with its magnitude."""
+        if isinstance(vector, EmbeddingResult):
+            return vector.array, vector.norm
+
+        array = np.asarray(vector, dtype=np.float64)
+        return array, float(np.linalg.norm(array))
 
     def _calculate_confidence(self, similarity_score: float, dimension: int) -> float:
         """
@@ -11,6 +11,7 @@ from knowledge_base_organizer.application.vault_analyzer import VaultAnalyzer
 from knowledge_base_organizer.infrastructure.config import ProcessingConfig
 
 
+@pytest.mark.slow
 class TestRealVaultAnalysis:
     """Test vault analysis with real test-myvault sample data."""
 
@@ -1,7 +1,7 @@
 """Tests for summarize command."""
 
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import click
 import pytest
@@ -18,6 +18,21 @@ class TestSummarizeCommand:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
+    @pytest.fixture(autouse=True)
+    def _patch_services(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the LLM factory and file repository for every test."""
+        self.mock_llm_service = Mock()
+        self.mock_create_llm = Mock(return_value=self.mock_llm_service)
+        self.mock_file_repo = Mock()
+        monkeypatch.setattr(
+            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service",
+            self.mock_create_llm,
+        )
+        monkeypatch.setattr(
+            "knowledge_base_organizer.cli.summarize_command.FileRepository",
+            Mock(return_value=self.mock_file_repo),
+        )
+
     def test_summarize_command_success(self, tmp_path: Any) -> None:
         """Test successful summarization of a markdown file."""
         # Create test file
@@ -46,7 +61,7 @@ Machine learning is used in various fields including:
         test_file.write_text(test_content)
 
         # Mock LLM service
-        mock_llm_service = Mock()
+        mock_llm_service = self.mock_llm_service
         mock_llm_service.summarize_content.return_value = (
             "機械学習は人工知能の一分野で、データから学習し予測を行うアルゴリズムに焦点を当てています。"
             "教師あり学習、教師なし学習、強化学習の3つの主要な手法があり、"
@@ -60,33 +75,22 @@ Machine learning is used in various fields including:
             content=test_content,
         )
 
-        with (
-            patch(
-                "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-            ) as mock_create_llm,
-            patch(
-                "knowledge_base_organizer.cli.summarize_command.FileRepository"
-            ) as mock_file_repo_class,
-        ):
-            # Setup mocks
-            mock_create_llm.return_value = mock_llm_service
-            mock_file_repo = Mock()
-            mock_file_repo.load_file.return_value = mock_markdown_file
-            mock_file_repo_class.return_value = mock_file_repo
-
-            # Run the command
-            summarize_command(
-                file_path=test_file,
-                max_length=200,
-                output_file=None,
-                verbose=False,
-            )
+        # Setup mocks
+        self.mock_file_repo.load_file.return_value = mock_markdown_file
 
-            # Verify LLM service was created and called
-            mock_create_llm.assert_called_once()
-            mock_llm_service.summarize_content.assert_called_once_with(
-                test_content, max_length=200
-            )
+        # Run the command
+        summarize_command(
+            file_path=test_file,
+            max_length=200,
+            output_file=None,
+            verbose=False,
+        )
+
+        # Verify LLM service was created and called
+        assert self.mock_create_llm.call_count == 1
+        mock_llm_service.summarize_content.assert_called_once_with(
+            test_content, max_length=200
+        )
 
     def test_summarize_command_with_output_file(self, tmp_path: Any) -> None:
         """Test summarization with output file specified."""
@@ -99,7 +103,7 @@ Machine learning is used in various fields including:
         output_file = tmp_path / "summary.md"
 
         # Mock LLM service
-        mock_llm_service = Mock()
+        mock_llm_service = self.mock_llm_service
         mock_llm_service.summarize_content.return_value = (
             "テストドキュメントの要約です。"
         )
@@ -111,38 +115,27 @@ Machine learning is used in various fields including:
             content=test_content,
         )
 
-        with (
-            patch(
-                "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-            ) as mock_create_llm,
-            patch(
-                "knowledge_base_organizer.cli.summarize_command.FileRepository"
-            ) as mock_file_repo_class,
-        ):
-            # Setup mocks
-            mock_create_llm.return_value = mock_llm_service
-            mock_file_repo = Mock()
-            mock_file_repo.load_file.return_value = mock_markdown_file
-            mock_file_repo_class.return_value = mock_file_repo
-
-            # Run the command with output file
-            summarize_command(
-                file_path=test_file,
-                max_length=100,
-                output_file=output_file,
-                verbose=True,
-            )
+        # Setup mocks
+        self.mock_file_repo.load_file.return_value = mock_markdown_file
 
-            # Verify output file was created
-            assert output_file.exists()
-            summary_content = output_file.read_text()
-            assert "テストドキュメントの要約です。" in summary_content
+        # Run the command with output file
+        summarize_command(
+            file_path=test_file,
+            max_length=100,
+            output_file=output_file,
+            verbose=True,
+        )
 
-            # Verify LLM service was called
-            mock_create_llm.assert_called_once()
-            mock_llm_service.summarize_content.assert_called_once_with(
-                test_content, max_length=100
-            )
+        # Verify output file was created
+        assert output_file.exists()
+        summary_content = output_file.read_text()
+        assert "テストドキュメントの要約です。" in summary_content
+
+        # Verify LLM service was called
+        assert self.mock_create_llm.call_count == 1
+        mock_llm_service.summarize_content.assert_called_once_with(
+            test_content, max_length=100
+        )
 
     def test_summarize_command_llm_service_failure(self, tmp_path: Any) -> None:
         """Test handling of LLM service initialization failure."""
@@ -150,25 +143,17 @@ Machine learning is used in various fields including:
         test_file = tmp_path / "test.md"
         test_file.write_text("# Test\nContent")
 
-        with (
-            patch(
-                "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-            ) as mock_create_llm,
-            patch(
-                "knowledge_base_organizer.cli.summarize_command.FileRepository"
-            ) as mock_file_repo_class,
-        ):
-            # Make LLM service creation fail
-            mock_create_llm.side_effect = Exception("LLM service unavailable")
-
-            # Should handle the error gracefully
-            with pytest.raises(click.exceptions.Exit):
-                summarize_command(
-                    file_path=test_file,
-                    max_length=200,
-                    output_file=None,
-                    verbose=False,
-                )
+        # Make LLM service creation fail
+        self.mock_create_llm.side_effect = Exception("LLM service unavailable")
+
+        # Should handle the error gracefully
+        with pytest.raises(click.exceptions.Exit):
+            summarize_command(
+                file_path=test_file,
+                max_length=200,
+                output_file=None,
+                verbose=False,
+            )
 
     def test_summarize_command_file_loading_failure(self, tmp_path: Any) -> None:
         """Test handling of file loading failure."""
@@ -176,31 +161,17 @@ Machine learning is used in various fields including:
         test_file = tmp_path / "test.md"
         test_file.write_text("# Test\nContent")
 
-        # Mock LLM service
-        mock_llm_service = Mock()
-
-        with (
-            patch(
-                "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-            ) as mock_create_llm,
-            patch(
-                "knowledge_base_organizer.cli.summarize_command.FileRepository"
-            ) as mock_file_repo_class,
-        ):
-            # Setup mocks
-            mock_create_llm.return_value = mock_llm_service
-            mock_file_repo = Mock()
-            mock_file_repo.load_file.side_effect = Exception("File loading failed")
-            mock_file_repo_class.return_value = mock_file_repo
-
-            # Should handle the error gracefully
-            with pytest.raises(click.exceptions.Exit):
-                summarize_command(
-                    file_path=test_file,
-                    max_length=200,
-                    output_file=None,
-                    verbose=False,
-                )
+        # Setup mocks
+        self.mock_file_repo.load_file.side_effect = Exception("File loading failed")
+
+        # Should handle the error gracefully
+        with pytest.raises(click.exceptions.Exit):
+            summarize_command(
+                file_path=test_file,
+                max_length=200,
+                output_file=None,
+                verbose=False,
+            )
 
     def test_summarize_command_summarization_failure(self, tmp_path: Any) -> None:
         """Test handling of summarization failure."""
@@ -210,7 +181,7 @@ Machine learning is used in various fields including:
         test_file.write_text(test_content)
 
         # Mock LLM service that fails during summarization
-        mock_llm_service = Mock()
+        mock_llm_service = self.mock_llm_service
         mock_llm_service.summarize_content.side_effect = Exception(
             "Summarization failed"
         )
@@ -222,28 +193,17 @@ Machine learning is used in various fields including:
             content=test_content,
         )
 
-        with (
-            patch(
-                "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-            ) as mock_create_llm,
-            patch(
-                "knowledge_base_organizer.cli.summarize_command.FileRepository"
-            ) as mock_file_repo_class,
-        ):
-            # Setup mocks
-            mock_create_llm.return_value = mock_llm_service
-            mock_file_repo = Mock()
-            mock_file_repo.load_file.return_value = mock_markdown_file
-            mock_file_repo_class.return_value = mock_file_repo
-
-            # Should handle the error gracefully
-            with pytest.raises(click.exceptions.Exit):
-                summarize_command(
-                    file_path=test_file,
-                    max_length=200,
-                    output_file=None,
-                    verbose=False,
-                )
+        # Setup mocks
+        self.mock_file_repo.load_file.return_value = mock_markdown_file
+
+        # Should handle the error gracefully
+        with pytest.raises(click.exceptions.Exit):
+            summarize_command(
+                file_path=test_file,
+                max_length=200,
+                output_file=None,
+                verbose=False,
+            )
 
     def test_summarize_command_empty_summary(self, tmp_path: Any) -> None:
         """Test handling of empty summary result."""
@@ -253,7 +213,7 @@ Machine learning is used in various fields including:
         test_file.write_text(test_content)
 
         # Mock LLM service that returns empty summary
-        mock_llm_service = Mock()
+        mock_llm_service = self.mock_llm_service
         mock_llm_service.summarize_content.return_value = ""
 
         # Create mock MarkdownFile
@@ -263,28 +223,17 @@ Machine learning is used in various fields including:
             content=test_content,
         )
 
-        with (
-            patch(
-                "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-            ) as mock_create_llm,
-            patch(
-                "knowledge_base_organizer.cli.summarize_command.FileRepository"
-            ) as mock_file_repo_class,
-        ):
-            # Setup mocks
-            mock_create_llm.return_value = mock_llm_service
-            mock_file_repo = Mock()
-            mock_file_repo.load_file.return_value = mock_markdown_file
-            mock_file_repo_class.return_value = mock_file_repo
-
-            # Should handle empty summary gracefully
-            summarize_command(
-                file_path=test_file,
-                max_length=200,
-                output_file=None,
-                verbose=False,
-            )
+        # Setup mocks
+        self.mock_file_repo.load_file.return_value = mock_markdown_file
+
+        # Should handle empty summary gracefully
+        summarize_command(
+            file_path=test_file,
+            max_length=200,
+            output_file=None,
+            verbose=False,
+        )
 
-            # Verify LLM service was called
-            mock_create_llm.assert_called_once()
-            mock_llm_service.summarize_content.assert_called_once()
+        # Verify LLM service was called
+        assert self.mock_create_llm.call_count == 1
+        assert mock_llm_service.summarize_content.call_count == 1
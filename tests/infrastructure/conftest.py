@@ -0,0 +1,145 @@
+"""Shared fixtures for infrastructure tests.
+
+Fixtures whose objects are never mutated by tests are session-scoped, so each
+pytest-xdist worker builds them once and reuses them across modules.
+"""
+
+import copy
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+
+from knowledge_base_organizer.infrastructure.llm_config import (
+    LLMConfig,
+    LLMConfigManager,
+    LLMProviderConfig,
+)
+from knowledge_base_organizer.infrastructure.llm_factory import LLMServiceFactory
+from knowledge_base_organizer.infrastructure.ollama_embedding import (
+    OllamaEmbeddingService,
+)
+from knowledge_base_organizer.infrastructure.ollama_llm import OllamaLLMService
+from knowledge_base_organizer.infrastructure.openai_compatible_llm import (
+    OpenAICompatibleLLMService,
+)
+
+# Provider settings shared by the factory tests; written to disk once per session
+TEST_CONFIG: dict[str, Any] = {
+    "default_provider": "ollama",
+    "providers": {
+        "ollama": {
+            "base_url": "http://localhost:11434",
+            "model_name": "qwen2.5:7b",
+            "timeout": 120,
+            "api_format": "ollama",
+            "options": {"temperature": 0.3},
+        },
+        "lm_studio": {
+            "base_url": "http://localhost:1234",
+            "model_name": "local-model",
+            "timeout": 60,
+            "api_format": "openai",
+            "options": {"temperature": 0.5, "max_tokens": 2048},
+        },
+    },
+}
+
+
+def write_config(path: Path, config: dict[str, Any]) -> Path:
+    """Write a YAML config file and return its path."""
+    path.write_text(yaml.dump(config), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def factory_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Factory test configuration file shared by every test in the session."""
+    return write_config(
+        tmp_path_factory.mktemp("llm_cfg") / "test_llm_config.yaml", TEST_CONFIG
+    )
+
+
+@pytest.fixture(scope="session")
+def integration_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Test configuration with an API key on the OpenAI-compatible provider."""
+    config = copy.deepcopy(TEST_CONFIG)
+    config["providers"]["lm_studio"]["api_key"] = "test-key"
+    return write_config(
+        tmp_path_factory.mktemp("llm_cfg") / "test_llm_config.yaml", config
+    )
+
+
+@pytest.fixture(scope="session")
+def factory(factory_config_file: Path) -> LLMServiceFactory:
+    """Factory over the shared test configuration, parsed once per session."""
+    return LLMServiceFactory(LLMConfigManager(factory_config_file))
+
+
+@pytest.fixture(scope="session")
+def integration_factory(integration_config_file: Path) -> LLMServiceFactory:
+    """Factory over the integration test configuration."""
+    return LLMServiceFactory(LLMConfigManager(integration_config_file))
+
+
+@pytest.fixture(scope="session")
+def mock_llm_config() -> LLMConfig:
+    """Validated configuration returned by the patched config manager."""
+    return LLMConfig(
+        default_provider="ollama",
+        providers={
+            "ollama": LLMProviderConfig(
+                base_url="http://localhost:11434",
+                model_name="qwen2.5:7b",
+                timeout=120,
+                api_format="ollama",
+                options={
+                    "temperature": 0.3,
+                    "top_p": 0.9,
+                    "top_k": 40,
+                    "num_predict": 2048,
+                },
+            )
+        },
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_service_template() -> MagicMock:
+    """Mock service built once; tests receive cheap copies of it."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_service(mock_service_template: MagicMock) -> MagicMock:
+    """Fresh mock service object for identity checks on created services.
+
+    The copy is shallow and shares child mocks with the template, so tests
+    should only compare it by identity rather than configure its attributes.
+    """
+    return copy.copy(mock_service_template)
+
+
+@pytest.fixture(scope="session")
+def embedding_service() -> OllamaEmbeddingService:
+    """Default embedding service shared by tests that do not change its state."""
+    with patch.object(OllamaEmbeddingService, "_verify_service_availability"):
+        return OllamaEmbeddingService()
+
+
+@pytest.fixture(scope="session")
+def ollama_service() -> OllamaLLMService:
+    """Default Ollama LLM service for tests of its offline helpers."""
+    with patch.object(OllamaLLMService, "_verify_service_availability"):
+        return OllamaLLMService()
+
+
+@pytest.fixture(scope="session")
+def openai_service() -> OpenAICompatibleLLMService:
+    """OpenAI-compatible LLM service for tests of its offline helpers."""
+    with patch.object(OpenAICompatibleLLMService, "_verify_service_availability"):
+        return OpenAICompatibleLLMService(
+            base_url="http://localhost:1234", model_name="local-model"
+        )
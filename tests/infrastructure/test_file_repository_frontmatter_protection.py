@@ -1,6 +1,5 @@
 """Tests for FileRepository frontmatter protection functionality."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -24,10 +23,9 @@ class TestFileRepositoryFrontmatterProtection:
         return FileRepository(config)
 
     @pytest.fixture
-    def temp_file_with_frontmatter(self):
-        """Create a temporary file with specific frontmatter formatting."""
-        temp_dir = tempfile.mkdtemp()
-        file_path = Path(temp_dir) / "test.md"
+    def temp_file_with_frontmatter(self, fs):
+        """Create an in-memory file with specific frontmatter formatting."""
+        file_path = Path("/vault/test.md")
 
         # Content with specific formatting that should be preserved
         content = """---
@@ -43,7 +41,7 @@ publish: false
 This is test content.
 """
 
-        file_path.write_text(content, encoding="utf-8")
+        fs.create_file(file_path, contents=content, encoding="utf-8")
         return file_path
 
     def test_preserve_frontmatter_formatting(
@@ -109,14 +107,15 @@ This is test content.
         assert "This content was changed." in saved_content
         assert "title: Test File" in saved_content
 
-    def test_preserve_frontmatter_with_no_original_frontmatter(self, file_repository):
+    def test_preserve_frontmatter_with_no_original_frontmatter(
+        self, fs, file_repository
+    ):
         """Test preserve_frontmatter behavior when original file has no frontmatter."""
-        temp_dir = tempfile.mkdtemp()
-        file_path = Path(temp_dir) / "no_frontmatter.md"
+        file_path = Path("/vault/no_frontmatter.md")
 
         # Content without frontmatter
         content = "# Test Content\n\nThis is test content."
-        file_path.write_text(content, encoding="utf-8")
+        fs.create_file(file_path, contents=content, encoding="utf-8")
 
         # Create MarkdownFile with frontmatter
         markdown_file = MarkdownFile(
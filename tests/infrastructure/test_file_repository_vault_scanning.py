@@ -9,57 +9,102 @@ from knowledge_base_organizer.domain.models import MarkdownFile
 from knowledge_base_organizer.infrastructure.config import ProcessingConfig
 from knowledge_base_organizer.infrastructure.file_repository import FileRepository
 
+# Pre-encoded markdown bodies shared across tests
+STANDARD_MD = b"---\ntitle: Test File\n---\n\n# Content\n"
+STANDARD_MD_WITH_ID = (
+    b'---\ntitle: Test File\nid: "20230101120000"\n---\n\n# Test Content\n'
+)
+
+
+def write_md(path: Path, body: bytes) -> None:
+    """Write pre-encoded markdown in a single call, creating parent dirs."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+
+
+@pytest.fixture
+def fake_vault(fs) -> Path:
+    """Empty vault directory on pyfakefs' in-memory filesystem."""
+    vault_path = Path("/vault")
+    fs.create_dir(vault_path)
+    return vault_path
+
+
+STANDARD_LAYOUT_FILES = {
+    # Nested markdown files for recursive discovery
+    "root.md": STANDARD_MD_WITH_ID,
+    "subdir1/level1.md": STANDARD_MD_WITH_ID,
+    "subdir1/subdir2/level2.md": STANDARD_MD_WITH_ID,
+    # Non-markdown files (should be ignored)
+    "readme.txt": b"Not markdown",
+    "subdir1/config.json": b"{}",
+    # Obsidian-style directory structure
+    "notes/note1.md": STANDARD_MD,
+    ".obsidian/config.md": STANDARD_MD,
+    ".obsidian/plugins/plugin.md": STANDARD_MD,
+    # File ID scenarios
+    "with_frontmatter_id.md": (
+        b'---\ntitle: File with ID\nid: "20230101120000"\n---\n\n# Content\n'
+    ),
+    "20230101120001.md": b"---\ntitle: Timestamp File\n---\n\n# Content\n",
+    "regular_name.md": b"---\ntitle: Regular File\n---\n\n# Content\n",
+}
+
+
+@pytest.fixture(scope="module")
+def vault_with_standard_layout(tmp_path_factory) -> Path:
+    """Read-only vault with the superset layout shared by happy-path tests."""
+    vault_path = tmp_path_factory.mktemp("standard_vault")
+    for relative_path, body in STANDARD_LAYOUT_FILES.items():
+        write_md(vault_path / relative_path, body)
+    return vault_path
+
 
 class TestFileRepositoryVaultScanning:
     """Test FileRepository vault scanning with include/exclude patterns."""
 
-    def test_load_vault_recursive_discovery(self) -> None:
+    def test_load_vault_recursive_discovery(
+        self, vault_with_standard_layout: Path
+    ) -> None:
         """Test recursive markdown file discovery."""
         config = ProcessingConfig.get_default_config()
         repo = FileRepository(config)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Load vault
+        markdown_files = repo.load_vault(vault_with_standard_layout)
 
-            # Create nested directory structure with markdown files
-            (temp_path / "subdir1").mkdir()
-            (temp_path / "subdir1" / "subdir2").mkdir()
+        # Should find every markdown file outside .obsidian
+        expected_files = 7
+        assert len(markdown_files) == expected_files
 
-            # Create markdown files at different levels
-            files_to_create = [
-                temp_path / "root.md",
-                temp_path / "subdir1" / "level1.md",
-                temp_path / "subdir1" / "subdir2" / "level2.md",
-            ]
+        # Check that all files are MarkdownFile instances
+        for file in markdown_files:
+            assert isinstance(file, MarkdownFile)
 
-            for file_path in files_to_create:
-                file_path.write_text("""---
-title: Test File
-id: "20230101120000"
----
+        files_by_path = {
+            f.path.relative_to(vault_with_standard_layout).as_posix(): f
+            for f in markdown_files
+        }
 
-# Test Content
-""")
+        # Markdown files at every nesting level are discovered
+        for relative_path in (
+            "root.md",
+            "subdir1/level1.md",
+            "subdir1/subdir2/level2.md",
+        ):
+            assert files_by_path[relative_path].frontmatter.title == "Test File"
+            assert files_by_path[relative_path].frontmatter.id == "20230101120000"
 
-            # Create non-markdown files (should be ignored)
-            (temp_path / "readme.txt").write_text("Not markdown")
-            (temp_path / "subdir1" / "config.json").write_text("{}")
-
-            # Load vault
-            markdown_files = repo.load_vault(temp_path)
-
-            # Should find all 3 markdown files
-            expected_files = 3
-            assert len(markdown_files) == expected_files
-
-            # Check that all files are MarkdownFile instances
-            for file in markdown_files:
-                assert isinstance(file, MarkdownFile)
-                assert file.frontmatter.title == "Test File"
-                assert file.frontmatter.id == "20230101120000"
+        # Non-markdown files are ignored
+        assert "readme.txt" not in files_by_path
+        assert "subdir1/config.json" not in files_by_path
 
     def test_load_vault_with_exclude_patterns(self) -> None:
-        """Test vault loading with exclude patterns."""
+        """Test vault loading with exclude patterns.
+
+        Runs against the real filesystem to validate rglob/exclude semantics
+        outside of pyfakefs.
+        """
         config = ProcessingConfig(
             include_patterns=["**/*.md"],
             exclude_patterns=["**/temp/**", "**/draft/**"],
@@ -83,12 +128,7 @@ id: "20230101120000"
             ]
 
             for file_path, _should_include in files_to_create:
-                file_path.write_text("""---
-title: Test File
----
-
-# Content
-""")
+                write_md(file_path, STANDARD_MD)
 
             # Load vault
             markdown_files = repo.load_vault(temp_path)
@@ -106,7 +146,9 @@ title: Test File
             assert "temp1.md" not in file_paths
             assert "draft1.md" not in file_paths
 
-    def test_load_vault_with_custom_include_patterns(self) -> None:
+    def test_load_vault_with_custom_include_patterns(
+        self, fs, fake_vault: Path
+    ) -> None:
         """Test vault loading with custom include patterns."""
         config = ProcessingConfig(
             include_patterns=["notes/*.md", "docs/**/*.md"],
@@ -114,147 +156,105 @@ title: Test File
         )
         repo = FileRepository(config)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Create markdown files
+        files_to_create = [
+            (fake_vault / "notes" / "note1.md", True),  # Matches notes/*.md
+            (fake_vault / "docs" / "doc1.md", True),  # Matches docs/**/*.md
+            (fake_vault / "docs" / "api" / "api1.md", True),  # Matches docs/**/*.md
+            (fake_vault / "other" / "other1.md", False),  # No matching pattern
+            (fake_vault / "root.md", False),  # No matching pattern
+        ]
 
-            # Create directories
-            (temp_path / "notes").mkdir()
-            (temp_path / "docs").mkdir()
-            (temp_path / "docs" / "api").mkdir()
-            (temp_path / "other").mkdir()
+        for file_path, _should_include in files_to_create:
+            fs.create_file(file_path, contents=STANDARD_MD)
 
-            # Create markdown files
-            files_to_create = [
-                (temp_path / "notes" / "note1.md", True),  # Matches notes/*.md
-                (temp_path / "docs" / "doc1.md", True),  # Matches docs/**/*.md
-                (temp_path / "docs" / "api" / "api1.md", True),  # Matches docs/**/*.md
-                (temp_path / "other" / "other1.md", False),  # No matching pattern
-                (temp_path / "root.md", False),  # No matching pattern
-            ]
-
-            for file_path, _should_include in files_to_create:
-                file_path.write_text("""---
-title: Test File
----
+        # Load vault
+        markdown_files = repo.load_vault(fake_vault)
 
-# Content
-""")
-
-            # Load vault
-            markdown_files = repo.load_vault(temp_path)
-
-            # Should only find files matching include patterns
-            expected_count = sum(
-                1 for _, should_include in files_to_create if should_include
-            )
-            assert len(markdown_files) == expected_count
-
-            file_paths = {file.path.name for file in markdown_files}
-            assert "note1.md" in file_paths
-            assert "doc1.md" in file_paths
-            assert "api1.md" in file_paths
-            assert "other1.md" not in file_paths
-            assert "root.md" not in file_paths
-
-    def test_load_vault_with_obsidian_exclusions(self) -> None:
+        # Should only find files matching include patterns
+        expected_count = sum(
+            1 for _, should_include in files_to_create if should_include
+        )
+        assert len(markdown_files) == expected_count
+
+        file_paths = {file.path.name for file in markdown_files}
+        assert "note1.md" in file_paths
+        assert "doc1.md" in file_paths
+        assert "api1.md" in file_paths
+        assert "other1.md" not in file_paths
+        assert "root.md" not in file_paths
+
+    def test_load_vault_with_obsidian_exclusions(
+        self, vault_with_standard_layout: Path
+    ) -> None:
         """Test vault loading with typical Obsidian exclusions."""
         config = ProcessingConfig.get_default_config()  # Includes .obsidian exclusion
         repo = FileRepository(config)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create Obsidian-style directory structure
-            (temp_path / ".obsidian").mkdir()
-            (temp_path / ".obsidian" / "plugins").mkdir()
-            (temp_path / "notes").mkdir()
-
-            # Create files
-            files_to_create = [
-                (temp_path / "notes" / "note1.md", True),  # Should be included
-                (temp_path / ".obsidian" / "config.md", False),  # Should be excluded
-                (
-                    temp_path / ".obsidian" / "plugins" / "plugin.md",
-                    False,
-                ),  # Should be excluded
-            ]
-
-            for file_path, _should_include in files_to_create:
-                file_path.write_text("""---
-title: Test File
----
+        # Load vault
+        markdown_files = repo.load_vault(vault_with_standard_layout)
 
-# Content
-""")
+        # Should only find files not in .obsidian directory
+        file_paths = {file.path.name for file in markdown_files}
+        assert "note1.md" in file_paths
+        assert "config.md" not in file_paths
+        assert "plugin.md" not in file_paths
 
-            # Load vault
-            markdown_files = repo.load_vault(temp_path)
-
-            # Should only find files not in .obsidian directory
-            expected_count = sum(
-                1 for _, should_include in files_to_create if should_include
-            )
-            assert len(markdown_files) == expected_count
-
-            file_paths = {file.path.name for file in markdown_files}
-            assert "note1.md" in file_paths
-            assert "config.md" not in file_paths
-            assert "plugin.md" not in file_paths
-
-    def test_load_vault_error_handling(self) -> None:
+    def test_load_vault_error_handling(self, fs, fake_vault: Path) -> None:
         """Test vault loading with error handling for malformed files."""
         config = ProcessingConfig.get_default_config()
         repo = FileRepository(config)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create files with various issues
-            files_to_create = [
-                (
-                    temp_path / "valid.md",
-                    """---
+        # Create files with various issues
+        files_to_create = [
+            (
+                fake_vault / "valid.md",
+                """---
 title: Valid File
 ---
 
 # Content
 """,
-                ),
-                (
-                    temp_path / "invalid_yaml.md",
-                    """---
+            ),
+            (
+                fake_vault / "invalid_yaml.md",
+                """---
 title: Invalid File
 invalid_yaml: [unclosed
 ---
 
 # Content
 """,
-                ),
-                (temp_path / "empty.md", ""),
-                (temp_path / "no_frontmatter.md", "# Just content"),
-            ]
+            ),
+            (fake_vault / "empty.md", ""),
+            (fake_vault / "no_frontmatter.md", "# Just content"),
+        ]
 
-            for file_path, content in files_to_create:
-                file_path.write_text(content)
+        for file_path, content in files_to_create:
+            fs.create_file(file_path, contents=content)
 
-            # Load vault - should handle errors gracefully
-            markdown_files = repo.load_vault(temp_path)
+        # Load vault - should handle errors gracefully
+        markdown_files = repo.load_vault(fake_vault)
 
-            # Should load all files, even those with issues
-            expected_files_with_errors = 4
-            assert len(markdown_files) == expected_files_with_errors
+        # Should load all files, even those with issues
+        expected_files_with_errors = 4
+        assert len(markdown_files) == expected_files_with_errors
 
-            # Find the valid file
-            valid_files = [f for f in markdown_files if f.path.name == "valid.md"]
-            assert len(valid_files) == 1
-            assert valid_files[0].frontmatter.title == "Valid File"
+        # Find the valid file
+        valid_files = [f for f in markdown_files if f.path.name == "valid.md"]
+        assert len(valid_files) == 1
+        assert valid_files[0].frontmatter.title == "Valid File"
 
-            # Files with issues should have empty/default frontmatter
-            invalid_files = [
-                f for f in markdown_files if f.path.name == "invalid_yaml.md"
-            ]
-            assert len(invalid_files) == 1
-            assert invalid_files[0].frontmatter.title is None
+        # Files with issues should have empty/default frontmatter
+        invalid_files = [f for f in markdown_files if f.path.name == "invalid_yaml.md"]
+        assert len(invalid_files) == 1
+        assert invalid_files[0].frontmatter.title is None
+
+        # Empty files are loaded with default frontmatter and no content
+        empty_files = [f for f in markdown_files if f.path.name == "empty.md"]
+        assert len(empty_files) == 1
+        assert empty_files[0].frontmatter.title is None
+        assert empty_files[0].content == ""
 
     def test_load_vault_nonexistent_path(self) -> None:
         """Test vault loading with nonexistent path."""
@@ -266,102 +266,166 @@ invalid_yaml: [unclosed
         with pytest.raises(ValueError, match="Vault path does not exist"):
             repo.load_vault(nonexistent_path)
 
-    def test_should_include_file_logic(self) -> None:
+    def test_iter_vault_yields_files_lazily(self, fs, fake_vault: Path) -> None:
+        """Test that iter_vault streams files and validates the path eagerly."""
+        repo = FileRepository(ProcessingConfig.get_default_config())
+
+        fs.create_file(fake_vault / "a.md", contents=STANDARD_MD)
+        fs.create_file(fake_vault / "notes" / "b.md", contents=STANDARD_MD)
+
+        files_iter = repo.iter_vault(fake_vault)
+        assert not isinstance(files_iter, list)
+        assert {f.path.name for f in files_iter} == {"a.md", "b.md"}
+
+        with pytest.raises(ValueError, match="Vault path does not exist"):
+            repo.iter_vault(fake_vault / "missing")
+
+    def test_should_include_file_logic(self, fs, fake_vault: Path) -> None:
         """Test the _should_include_file method logic."""
         config = ProcessingConfig(
             exclude_patterns=["**/temp/**", "**/.git/**", "**/node_modules/**"]
         )
         repo = FileRepository(config)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Test cases: (relative_path, should_include)
-            test_cases = [
-                ("notes/file.md", True),
-                ("temp/file.md", False),
-                ("project/temp/file.md", False),
-                (".git/config", False),
-                ("project/.git/hooks/file", False),
-                ("node_modules/package/file.md", False),
-                ("src/node_modules/lib/file.md", False),
-                ("regular/file.md", True),
-            ]
-
-            for relative_path_str, expected in test_cases:
-                file_path = temp_path / relative_path_str
-                # Create the file and its parent directories
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_text("# Test content")
-
-                result = repo._should_include_file(file_path, temp_path)
-                assert result == expected, (
-                    f"Failed for {relative_path_str}: expected {expected}, got {result}"
-                )
+        # Test cases: (relative_path, should_include)
+        test_cases = [
+            ("notes/file.md", True),
+            ("temp/file.md", False),
+            ("project/temp/file.md", False),
+            (".git/config", False),
+            ("project/.git/hooks/file", False),
+            ("node_modules/package/file.md", False),
+            ("src/node_modules/lib/file.md", False),
+            ("regular/file.md", True),
+        ]
+
+        for relative_path_str, expected in test_cases:
+            # Create the file and its parent directories
+            file_path = fake_vault / relative_path_str
+            fs.create_file(file_path, contents="# Test content")
+
+            result = repo._should_include_file(file_path, fake_vault)
+            assert result == expected, (
+                f"Failed for {relative_path_str}: expected {expected}, got {result}"
+            )
 
-    def test_load_vault_with_file_id_extraction(self) -> None:
+    def test_load_vault_with_file_id_extraction(
+        self, vault_with_standard_layout: Path
+    ) -> None:
         """Test vault loading with proper file ID extraction."""
         config = ProcessingConfig.get_default_config()
         repo = FileRepository(config)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Load vault
+        markdown_files = repo.load_vault(vault_with_standard_layout)
 
-            # Create files with different ID scenarios
-            files_to_create = [
-                # File with ID in frontmatter
-                (
-                    temp_path / "with_frontmatter_id.md",
-                    """---
-title: File with ID
-id: "20230101120000"
----
+        # Check ID extraction
+        files_by_name = {f.path.name: f for f in markdown_files}
 
-# Content
-""",
-                ),
-                # File with 14-digit filename (Obsidian timestamp)
-                (
-                    temp_path / "20230101120001.md",
-                    """---
-title: Timestamp File
----
+        # File with frontmatter ID
+        frontmatter_file = files_by_name["with_frontmatter_id.md"]
+        assert frontmatter_file.file_id == "20230101120000"
 
-# Content
-""",
-                ),
-                # File with regular name, no ID
-                (
-                    temp_path / "regular_name.md",
-                    """---
-title: Regular File
----
-
-# Content
-""",
-                ),
-            ]
+        # File with timestamp filename
+        timestamp_file = files_by_name["20230101120001.md"]
+        assert timestamp_file.file_id == "20230101120001"
 
-            for file_path, content in files_to_create:
-                file_path.write_text(content)
+        # File with no ID
+        regular_file = files_by_name["regular_name.md"]
+        assert regular_file.file_id is None
 
-            # Load vault
-            markdown_files = repo.load_vault(temp_path)
+    def test_should_include_file_with_mixed_patterns(
+        self, fs, fake_vault: Path
+    ) -> None:
+        """Test directory and fnmatch exclude patterns combined in one config."""
+        config = ProcessingConfig(exclude_patterns=["**/temp/**", "drafts/*.md"])
+        repo = FileRepository(config)
 
-            expected_files_with_ids = 3
-            assert len(markdown_files) == expected_files_with_ids
+        test_cases = [
+            ("notes/file.md", True),
+            ("temp/file.md", False),
+            ("notes/temp/file.md", False),
+            ("notes/temporary.md", True),
+            ("drafts/idea.md", False),
+            ("notes/drafts/idea.md", True),
+        ]
+
+        for relative_path_str, expected in test_cases:
+            file_path = fake_vault / relative_path_str
+            fs.create_file(file_path, contents="# Test content")
+
+            result = repo._should_include_file(file_path, fake_vault)
+            assert result == expected, (
+                f"Failed for {relative_path_str}: expected {expected}, got {result}"
+            )
 
-            # Check ID extraction
-            files_by_name = {f.path.name: f for f in markdown_files}
+    def test_hyperscan_exclude_matching_agrees_with_regex(self) -> None:
+        """Test the hyperscan exclude path against the combined regex path."""
+        pytest.importorskip("hyperscan")
+
+        exclude_patterns = [
+            "**/temp/**",
+            "**/.git/**",
+            "**/node_modules/**",
+            "**/.obsidian/**",
+            "**/draft/**",
+            "drafts/*.md",
+            "**/*.tmp.md",
+            "archive/[0-9]*.md",
+        ]
+        repo = FileRepository(ProcessingConfig(exclude_patterns=exclude_patterns))
+        assert repo._exclude_db is not None
+
+        relative_paths = [
+            "notes/file.md",
+            "temp/file.md",
+            "project/temp/file.md",
+            "notes/temporary.md",
+            ".obsidian/plugins/plugin.md",
+            "drafts/idea.md",
+            "notes/drafts/idea.md",
+            "notes/scratch.tmp.md",
+            "archive/2023.md",
+            "archive/old.md",
+            "日本語/ノート.md",
+            "日本語/draft/ノート.md",
+        ]
+
+        for relative_path in relative_paths:
+            expected = repo._exclude_re.match(relative_path) is not None
+            assert repo._is_excluded(relative_path) == expected, relative_path
+
+    def test_should_include_file_with_relative_vault_path(
+        self, fs, monkeypatch
+    ) -> None:
+        """Test exclusion when the vault is given as a relative path."""
+        repo = FileRepository(ProcessingConfig(exclude_patterns=["**/temp/**"]))
+
+        fs.create_file("/work/notes/file.md", contents=STANDARD_MD)
+        fs.create_file("/work/temp/file.md", contents=STANDARD_MD)
+        monkeypatch.chdir("/work")
+
+        files = repo.load_vault(Path("."))
+
+        assert [f.path.as_posix() for f in files] == ["notes/file.md"]
+
+    def test_walk_vault_prunes_excluded_directories(self, fake_vault: Path) -> None:
+        """Test that **/NAME/** exclusions stop the walk from entering NAME."""
+        repo = FileRepository(
+            ProcessingConfig(exclude_patterns=["**/.obsidian/**", "**/temp/**"])
+        )
 
-            # File with frontmatter ID
-            frontmatter_file = files_by_name["with_frontmatter_id.md"]
-            assert frontmatter_file.file_id == "20230101120000"
+        write_md(fake_vault / "notes" / "file.md", STANDARD_MD)
+        write_md(fake_vault / "notes" / "temp" / "file.md", STANDARD_MD)
+        write_md(fake_vault / ".obsidian" / "plugins" / "plugin.md", STANDARD_MD)
+        write_md(fake_vault / "temporary" / "file.md", STANDARD_MD)
 
-            # File with timestamp filename
-            timestamp_file = files_by_name["20230101120001.md"]
-            assert timestamp_file.file_id == "20230101120001"
+        walked = {
+            p.relative_to(fake_vault).as_posix() for p in repo._walk_vault(fake_vault)
+        }
 
-            # File with no ID
-            regular_file = files_by_name["regular_name.md"]
-            assert regular_file.file_id is None
+        assert walked == {"notes/file.md", "temporary/file.md"}
+        assert {f.path for f in repo.load_vault(fake_vault)} == {
+            fake_vault / "notes" / "file.md",
+            fake_vault / "temporary" / "file.md",
+        }
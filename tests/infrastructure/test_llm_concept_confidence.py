@@ -0,0 +1,28 @@
+"""Tests for concept confidence scoring shared by the LLM services."""
+
+import pytest
+
+
+@pytest.mark.parametrize("service_fixture", ["ollama_service", "openai_service"])
+def test_calculate_concept_confidence(service_fixture, request):
+    """Test concept confidence calculation."""
+    llm_service = request.getfixturevalue(service_fixture)
+    content = "This is about Python programming and machine learning algorithms."
+
+    # Concept that appears in content
+    confidence1 = llm_service._calculate_concept_confidence("Python", content)
+    assert confidence1 > 0.5
+
+    # Concept that doesn't appear in content
+    confidence2 = llm_service._calculate_concept_confidence("Java", content)
+    assert confidence2 == 0.6  # Base confidence plus technical-term boost
+
+    # Long, specific concept
+    confidence3 = llm_service._calculate_concept_confidence(
+        "machine_learning_algorithm", content
+    )
+    assert confidence3 > 0.5  # Gets boost for length and underscores
+
+    # Multi-word concept that appears in content
+    confidence4 = llm_service._calculate_concept_confidence("machine learning", content)
+    assert 0.5 < confidence4 <= 1.0
@@ -1,7 +1,6 @@
 """Tests for LLM configuration management."""
 
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -85,16 +84,10 @@ class TestLLMConfig:
 class TestLLMConfigManager:
     """Test LLM configuration manager."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.config_file = self.temp_dir / "llm_config.yaml"
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture
+    def config_file(self, tmp_path: Path) -> Path:
+        """Path for the test config file inside pytest's tmp_path."""
+        return tmp_path / "llm_config.yaml"
 
     def test_config_manager_initialization(self):
         """Test config manager initialization."""
@@ -102,12 +95,12 @@ class TestLLMConfigManager:
         assert manager.config_path is None
         assert manager._config is None
 
-    def test_config_manager_with_custom_path(self):
+    def test_config_manager_with_custom_path(self, config_file):
         """Test config manager with custom path."""
-        manager = LLMConfigManager(self.config_file)
-        assert manager.config_path == self.config_file
+        manager = LLMConfigManager(config_file)
+        assert manager.config_path == config_file
 
-    def test_load_config_from_file(self):
+    def test_load_config_from_file(self, config_file):
         """Test loading configuration from file."""
         # Create test config file
         config_data = {
@@ -123,19 +116,19 @@ class TestLLMConfigManager:
             },
         }
 
-        with open(self.config_file, "w") as f:
+        with open(config_file, "w") as f:
             yaml.dump(config_data, f)
 
-        manager = LLMConfigManager(self.config_file)
+        manager = LLMConfigManager(config_file)
         config = manager.load_config()
 
         assert config.default_provider == "ollama"
         assert "ollama" in config.providers
         assert config.providers["ollama"].model_name == "qwen2.5:7b"
 
-    def test_load_config_default_when_no_file(self):
+    def test_load_config_default_when_no_file(self, tmp_path):
         """Test loading default configuration when no file exists."""
-        non_existent_file = self.temp_dir / "non_existent.yaml"
+        non_existent_file = tmp_path / "non_existent.yaml"
         manager = LLMConfigManager(non_existent_file)
         config = manager.load_config()
 
@@ -170,7 +163,66 @@ class TestLLMConfigManager:
             assert result["providers"]["ollama"]["base_url"] == "http://custom:11434"
             assert result["providers"]["ollama"]["model_name"] == "llama3.1:8b"
 
-    def test_get_provider_config(self):
+    def test_apply_env_overrides_without_env_is_noop(self, monkeypatch):
+        """Test that config data is returned as-is when no overrides are set."""
+        for env_key in (
+            "LLM_PROVIDER",
+            "OLLAMA_BASE_URL",
+            "OLLAMA_MODEL",
+            "LM_STUDIO_BASE_URL",
+            "OPENAI_API_KEY",
+            "OPENAI_BASE_URL",
+        ):
+            monkeypatch.delenv(env_key, raising=False)
+
+        manager = LLMConfigManager()
+        config_data = {
+            "default_provider": "ollama",
+            "providers": {
+                "ollama": {
+                    "base_url": "http://localhost:11434",
+                    "model_name": "qwen2.5:7b",
+                }
+            },
+        }
+        expected = {
+            "default_provider": "ollama",
+            "providers": {
+                "ollama": {
+                    "base_url": "http://localhost:11434",
+                    "model_name": "qwen2.5:7b",
+                }
+            },
+        }
+
+        result = manager._apply_env_overrides(config_data)
+
+        # Same object, not a defensive copy, and left unmodified
+        assert result is config_data
+        assert result == expected
+
+    def test_apply_env_overrides_creates_missing_providers(self):
+        """Test environment overrides for providers absent from the config."""
+        manager = LLMConfigManager()
+
+        with patch.dict(
+            os.environ,
+            {
+                "LM_STUDIO_BASE_URL": "http://localhost:1234",
+                "OPENAI_API_KEY": "sk-test",
+                "OPENAI_BASE_URL": "https://api.example.com",
+            },
+        ):
+            result = manager._apply_env_overrides({})
+
+            providers = result["providers"]
+            assert providers["lm_studio"]["base_url"] == "http://localhost:1234"
+            assert providers["openai_compatible"]["api_key"] == "sk-test"
+            assert (
+                providers["openai_compatible"]["base_url"] == "https://api.example.com"
+            )
+
+    def test_get_provider_config(self, config_file):
         """Test getting provider configuration."""
         config_data = {
             "default_provider": "ollama",
@@ -187,10 +239,10 @@ class TestLLMConfigManager:
             },
         }
 
-        with open(self.config_file, "w") as f:
+        with open(config_file, "w") as f:
             yaml.dump(config_data, f)
 
-        manager = LLMConfigManager(self.config_file)
+        manager = LLMConfigManager(config_file)
 
         # Test default provider
         default_config = manager.get_provider_config()
@@ -201,14 +253,14 @@ class TestLLMConfigManager:
         assert lm_studio_config.base_url == "http://localhost:1234"
         assert lm_studio_config.api_format == "openai"
 
-    def test_get_provider_config_invalid_provider(self):
+    def test_get_provider_config_invalid_provider(self, config_file):
         """Test getting configuration for invalid provider."""
-        manager = LLMConfigManager(self.config_file)
+        manager = LLMConfigManager(config_file)
 
         with pytest.raises(ValueError, match="Unknown provider: invalid"):
             manager.get_provider_config("invalid")
 
-    def test_list_available_providers(self):
+    def test_list_available_providers(self, config_file):
         """Test listing available providers."""
         config_data = {
             "default_provider": "ollama",
@@ -224,17 +276,17 @@ class TestLLMConfigManager:
             },
         }
 
-        with open(self.config_file, "w") as f:
+        with open(config_file, "w") as f:
             yaml.dump(config_data, f)
 
-        manager = LLMConfigManager(self.config_file)
+        manager = LLMConfigManager(config_file)
         providers = manager.list_available_providers()
 
         assert "ollama" in providers
         assert "lm_studio" in providers
         assert len(providers) == 2
 
-    def test_list_available_models(self):
+    def test_list_available_models(self, config_file):
         """Test listing available models for a provider."""
         config_data = {
             "default_provider": "ollama",
@@ -247,10 +299,10 @@ class TestLLMConfigManager:
             },
         }
 
-        with open(self.config_file, "w") as f:
+        with open(config_file, "w") as f:
             yaml.dump(config_data, f)
 
-        manager = LLMConfigManager(self.config_file)
+        manager = LLMConfigManager(config_file)
         models = manager.list_available_models("ollama")
 
         assert "qwen2.5:7b" in models
@@ -258,10 +310,10 @@ class TestLLMConfigManager:
         assert "qwen2.5:14b" in models
         assert len(models) == 3
 
-    def test_create_user_config_template(self):
+    def test_create_user_config_template(self, tmp_path):
         """Test creating user configuration template."""
         manager = LLMConfigManager()
-        template_file = self.temp_dir / "template.yaml"
+        template_file = tmp_path / "template.yaml"
 
         manager.create_user_config_template(template_file)
 
@@ -274,7 +326,7 @@ class TestLLMConfigManager:
         assert "ollama" in template_data["providers"]
         assert "lm_studio" in template_data["providers"]
 
-    def test_config_caching(self):
+    def test_config_caching(self, config_file):
         """Test configuration caching."""
         config_data = {
             "default_provider": "ollama",
@@ -286,10 +338,10 @@ class TestLLMConfigManager:
             },
         }
 
-        with open(self.config_file, "w") as f:
+        with open(config_file, "w") as f:
             yaml.dump(config_data, f)
 
-        manager = LLMConfigManager(self.config_file)
+        manager = LLMConfigManager(config_file)
 
         # First load
         config1 = manager.load_config()
@@ -298,6 +350,33 @@ class TestLLMConfigManager:
 
         assert config1 is config2  # Same object due to caching
 
+    def test_config_reloaded_when_file_changes(self, config_file):
+        """Test that the cached configuration is invalidated by file changes."""
+        config_data = {
+            "default_provider": "ollama",
+            "providers": {
+                "ollama": {
+                    "base_url": "http://localhost:11434",
+                    "model_name": "qwen2.5:7b",
+                }
+            },
+        }
+
+        with open(config_file, "w") as f:
+            yaml.dump(config_data, f)
+
+        manager = LLMConfigManager(config_file)
+        config1 = manager.load_config()
+
+        config_data["providers"]["ollama"]["model_name"] = "llama3.1:8b"
+        with open(config_file, "w") as f:
+            yaml.dump(config_data, f)
+
+        config2 = manager.load_config()
+
+        assert config2 is not config1
+        assert config2.providers["ollama"].model_name == "llama3.1:8b"
+
 
 class TestGlobalFunctions:
     """Test global configuration functions."""
@@ -326,85 +405,64 @@ class TestGlobalFunctions:
         assert isinstance(config, LLMConfig)
         assert config.default_provider == "ollama"
 
-    def test_get_llm_config_with_custom_path(self):
+    def test_get_llm_config_with_custom_path(self, tmp_path):
         """Test getting LLM configuration with custom path."""
-        temp_dir = Path(tempfile.mkdtemp())
-        config_file = temp_dir / "custom_config.yaml"
-
-        try:
-            config_data = {
-                "default_provider": "custom",
-                "providers": {
-                    "custom": {
-                        "base_url": "http://custom:8000",
-                        "model_name": "custom-model",
-                    }
-                },
-            }
+        config_file = tmp_path / "custom_config.yaml"
 
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
-
-            config = get_llm_config(config_file)
+        config_data = {
+            "default_provider": "custom",
+            "providers": {
+                "custom": {
+                    "base_url": "http://custom:8000",
+                    "model_name": "custom-model",
+                }
+            },
+        }
 
-            assert config.default_provider == "ollama"  # Default from built-in config
-            assert "custom" in config.providers
+        with open(config_file, "w") as f:
+            yaml.dump(config_data, f)
 
-        finally:
-            import shutil
+        config = get_llm_config(config_file)
 
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        assert config.default_provider == "ollama"  # Default from built-in config
+        assert "custom" in config.providers
 
 
 class TestConfigValidation:
     """Test configuration validation."""
 
-    def test_invalid_yaml_file(self):
+    def test_invalid_yaml_file(self, tmp_path):
         """Test handling of invalid YAML file."""
-        temp_dir = Path(tempfile.mkdtemp())
-        config_file = temp_dir / "invalid.yaml"
-
-        try:
-            # Create invalid YAML
-            with open(config_file, "w") as f:
-                f.write("invalid: yaml: content: [")
-
-            manager = LLMConfigManager(config_file)
-            config = manager.load_config()  # Should fall back to default
+        config_file = tmp_path / "invalid.yaml"
 
-            assert config.default_provider == "ollama"
+        # Create invalid YAML
+        with open(config_file, "w") as f:
+            f.write("invalid: yaml: content: [")
 
-        finally:
-            import shutil
+        manager = LLMConfigManager(config_file)
+        config = manager.load_config()  # Should fall back to default
 
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        assert config.default_provider == "ollama"
 
-    def test_missing_required_fields(self):
+    def test_missing_required_fields(self, tmp_path):
         """Test handling of missing required fields."""
-        temp_dir = Path(tempfile.mkdtemp())
-        config_file = temp_dir / "incomplete.yaml"
-
-        try:
-            # Create config with missing required fields
-            config_data = {
-                "providers": {
-                    "ollama": {
-                        "base_url": "http://localhost:11434"
-                        # Missing model_name
-                    }
+        config_file = tmp_path / "incomplete.yaml"
+
+        # Create config with missing required fields
+        config_data = {
+            "providers": {
+                "ollama": {
+                    "base_url": "http://localhost:11434"
+                    # Missing model_name
                 }
             }
+        }
 
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
-
-            manager = LLMConfigManager(config_file)
-
-            # Should raise validation error when creating LLMConfig
-            with pytest.raises(Exception):  # Pydantic validation error
-                manager.load_config()
+        with open(config_file, "w") as f:
+            yaml.dump(config_data, f)
 
-        finally:
-            import shutil
+        manager = LLMConfigManager(config_file)
 
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        # Should raise validation error when creating LLMConfig
+        with pytest.raises(Exception):  # Pydantic validation error
+            manager.load_config()
@@ -0,0 +1,58 @@
+"""
+Tests for OllamaEmbeddingService availability verification
+
+These tests run the real _verify_service_availability against mocked
+Ollama endpoints, so they live apart from the tests that skip it.
+"""
+
+import pytest
+import requests
+
+from knowledge_base_organizer.domain.services.ai_services import (
+    ModelNotAvailableError,
+)
+from knowledge_base_organizer.infrastructure.ollama_embedding import (
+    OllamaEmbeddingService,
+)
+
+OLLAMA_URL = "http://localhost:11434"
+
+# Response payloads shared across tests; none of the tests mutate them
+TAGS_WITH_MODEL = {"models": [{"name": "nomic-embed-text"}, {"name": "other-model"}]}
+TAGS_WITHOUT_MODEL = {"models": [{"name": "other-model"}]}
+
+
+class TestOllamaEmbeddingServiceAvailability:
+    """Test cases for OllamaEmbeddingService availability verification"""
+
+    def test_verify_service_availability_success(self, requests_mock):
+        """Test successful service availability verification"""
+        requests_mock.get(f"{OLLAMA_URL}/api/tags", json=TAGS_WITH_MODEL)
+
+        # Should not raise an exception
+        service = OllamaEmbeddingService()
+        assert service.model_name == "nomic-embed-text"
+
+    def test_verify_service_availability_service_down(self, requests_mock):
+        """Test service availability when Ollama is not running"""
+        requests_mock.get(
+            f"{OLLAMA_URL}/api/tags",
+            exc=requests.exceptions.ConnectionError("Connection refused"),
+        )
+
+        with pytest.raises(
+            ModelNotAvailableError, match="Ollama service not available"
+        ):
+            OllamaEmbeddingService()
+
+    def test_verify_service_availability_model_missing(self, requests_mock):
+        """Test service availability when model is missing but can be pulled"""
+        # Mock the tags response (model not available)
+        requests_mock.get(f"{OLLAMA_URL}/api/tags", json=TAGS_WITHOUT_MODEL)
+        pull = requests_mock.post(f"{OLLAMA_URL}/api/pull")
+
+        # Should successfully pull the model
+        service = OllamaEmbeddingService()
+
+        assert service.model_name == "nomic-embed-text"
+        assert pull.call_count == 1
@@ -5,6 +5,7 @@ Tests for OllamaLLMService implementation.
 from unittest.mock import patch
 
 import pytest
+import requests
 
 from knowledge_base_organizer.domain.services.ai_services import (
     ConceptExtractionResult,
@@ -16,28 +17,53 @@ from knowledge_base_organizer.domain.services.ai_services import (
 )
 from knowledge_base_organizer.infrastructure.ollama_llm import OllamaLLMService
 
+# Response payloads shared across tests; none of the tests mutate them
+TAGS_RESPONSE = {"models": [{"name": "llama3.2:3b"}]}
+CONCEPTS_RESPONSE = {
+    "response": "machine learning, artificial intelligence, neural networks"
+}
+METADATA_RESPONSE = {
+    "response": "TAGS: ai, machine-learning\nALIASES: ML, AI\nDESCRIPTION: About AI concepts"
+}
+SUMMARY_RESPONSE = {"response": "This is a summary of the content."}
+RELATIONSHIP_RESPONSE = {
+    "response": "RELATIONSHIP: PREMISE\nCONFIDENCE: 0.8\nBIDIRECTIONAL: true\nEXPLANATION: Content A provides foundation for B"
+}
+CONTEXT_MATCH_RESPONSE = {
+    "response": "SCORE: 0.8\nCONFIDENCE: 0.9\nMATCH: true\nREASONING: Good semantic match"
+}
+DISAMBIGUATION_RESPONSE = {"response": "TARGET_1: 0.8\nTARGET_2: 0.6"}
+MODEL_INFO_RESPONSE = {
+    "details": {"parameter_size": "3B"},
+    "parameters": {"temperature": 0.3},
+}
+
 
 class TestOllamaLLMService:
     """Test cases for OllamaLLMService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_requests(self):
-        """Mock requests module for testing."""
+        """Mock requests module, patched once for the whole module."""
         with patch(
             "knowledge_base_organizer.infrastructure.ollama_llm.requests"
         ) as mock:
             # Mock successful service availability check
-            mock.get.return_value.json.return_value = {
-                "models": [{"name": "llama3.2:3b"}]
-            }
+            mock.get.return_value.json.return_value = TAGS_RESPONSE
             mock.get.return_value.raise_for_status.return_value = None
             yield mock
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def llm_service(self, mock_requests):
-        """Create OllamaLLMService instance for testing."""
+        """Create one OllamaLLMService instance shared by the module's tests."""
         return OllamaLLMService()
 
+    @pytest.fixture(autouse=True)
+    def _reset_post_mock(self, mock_requests):
+        """Keep per-test LLM responses and errors from leaking into other tests."""
+        yield
+        mock_requests.post.reset_mock(return_value=True, side_effect=True)
+
     def test_initialization(self, mock_requests):
         """Test service initialization."""
         service = OllamaLLMService(
@@ -54,20 +80,18 @@ class TestOllamaLLMService:
         service = OllamaLLMService()
         assert service is not None
 
-    def test_service_unavailable_error(self):
+    def test_service_unavailable_error(self, mock_requests, monkeypatch):
         """Test error when Ollama service is unavailable."""
-        with patch(
-            "knowledge_base_organizer.infrastructure.ollama_llm.requests"
-        ) as mock:
-            import requests
-
-            mock.get.side_effect = requests.exceptions.RequestException(
-                "Connection failed"
-            )
-            mock.exceptions = requests.exceptions
+        # Swap attributes on the module-wide mock; undone after the test
+        monkeypatch.setattr(
+            mock_requests.get,
+            "side_effect",
+            requests.exceptions.RequestException("Connection failed"),
+        )
+        monkeypatch.setattr(mock_requests, "exceptions", requests.exceptions)
 
-            with pytest.raises(ModelNotAvailableError):
-                OllamaLLMService()
+        with pytest.raises(ModelNotAvailableError):
+            OllamaLLMService()
 
     def test_extract_concepts_empty_content(self, llm_service):
         """Test concept extraction with empty content."""
@@ -81,9 +105,7 @@ class TestOllamaLLMService:
     def test_extract_concepts_success(self, llm_service, mock_requests):
         """Test successful concept extraction."""
         # Mock successful LLM response
-        mock_requests.post.return_value.json.return_value = {
-            "response": "machine learning, artificial intelligence, neural networks"
-        }
+        mock_requests.post.return_value.json.return_value = CONCEPTS_RESPONSE
         mock_requests.post.return_value.raise_for_status.return_value = None
 
         result = llm_service.extract_concepts("This is about machine learning and AI.")
@@ -104,9 +126,7 @@ class TestOllamaLLMService:
     def test_suggest_metadata_success(self, llm_service, mock_requests):
         """Test successful metadata suggestion."""
         # Mock successful LLM response
-        mock_requests.post.return_value.json.return_value = {
-            "response": "TAGS: ai, machine-learning\nALIASES: ML, AI\nDESCRIPTION: About AI concepts"
-        }
+        mock_requests.post.return_value.json.return_value = METADATA_RESPONSE
         mock_requests.post.return_value.raise_for_status.return_value = None
 
         result = llm_service.suggest_metadata("This is about machine learning.")
@@ -124,9 +144,7 @@ class TestOllamaLLMService:
     def test_summarize_content_success(self, llm_service, mock_requests):
         """Test successful content summarization."""
         # Mock successful LLM response
-        mock_requests.post.return_value.json.return_value = {
-            "response": "This is a summary of the content."
-        }
+        mock_requests.post.return_value.json.return_value = SUMMARY_RESPONSE
         mock_requests.post.return_value.raise_for_status.return_value = None
 
         result = llm_service.summarize_content("Long content to summarize...")
@@ -145,9 +163,7 @@ class TestOllamaLLMService:
     def test_analyze_relationship_success(self, llm_service, mock_requests):
         """Test successful relationship analysis."""
         # Mock successful LLM response
-        mock_requests.post.return_value.json.return_value = {
-            "response": "RELATIONSHIP: PREMISE\nCONFIDENCE: 0.8\nBIDIRECTIONAL: true\nEXPLANATION: Content A provides foundation for B"
-        }
+        mock_requests.post.return_value.json.return_value = RELATIONSHIP_RESPONSE
         mock_requests.post.return_value.raise_for_status.return_value = None
 
         result = llm_service.analyze_relationship("Content A", "Content B")
@@ -175,9 +191,7 @@ class TestOllamaLLMService:
     def test_evaluate_context_match_success(self, llm_service, mock_requests):
         """Test successful context evaluation."""
         # Mock successful LLM response
-        mock_requests.post.return_value.json.return_value = {
-            "response": "SCORE: 0.8\nCONFIDENCE: 0.9\nMATCH: true\nREASONING: Good semantic match"
-        }
+        mock_requests.post.return_value.json.return_value = CONTEXT_MATCH_RESPONSE
         mock_requests.post.return_value.raise_for_status.return_value = None
 
         result = llm_service.evaluate_context_match(
@@ -194,9 +208,7 @@ class TestOllamaLLMService:
     def test_disambiguate_targets_success(self, llm_service, mock_requests):
         """Test successful target disambiguation."""
         # Mock successful LLM response
-        mock_requests.post.return_value.json.return_value = {
-            "response": "TARGET_1: 0.8\nTARGET_2: 0.6"
-        }
+        mock_requests.post.return_value.json.return_value = DISAMBIGUATION_RESPONSE
         mock_requests.post.return_value.raise_for_status.return_value = None
 
         targets = [("id1", "content1"), ("id2", "content2")]
@@ -206,13 +218,13 @@ class TestOllamaLLMService:
         assert len(result) == 2
         assert all(isinstance(item, tuple) and len(item) == 2 for item in result)
 
-    def test_get_model_info(self, llm_service, mock_requests):
+    def test_get_model_info(self, mock_requests):
         """Test getting model information."""
+        # get_model_info caches its result, so use a service of our own
+        llm_service = OllamaLLMService()
+
         # Mock successful model info response
-        mock_requests.post.return_value.json.return_value = {
-            "details": {"parameter_size": "3B"},
-            "parameters": {"temperature": 0.3},
-        }
+        mock_requests.post.return_value.json.return_value = MODEL_INFO_RESPONSE
         mock_requests.post.return_value.raise_for_status.return_value = None
 
         info = llm_service.get_model_info()
@@ -230,21 +242,6 @@ class TestOllamaLLMService:
         with pytest.raises(LLMError):
             llm_service.extract_concepts("test content")
 
-    def test_calculate_concept_confidence(self, llm_service):
-        """Test concept confidence calculation."""
-        # Test with concept that appears in content
-        confidence = llm_service._calculate_concept_confidence(
-            "machine learning", "This is about machine learning"
-        )
-        assert 0.0 <= confidence <= 1.0
-        assert confidence > 0.5  # Should be boosted for appearing in content
-
-        # Test with concept that doesn't appear in content
-        confidence = llm_service._calculate_concept_confidence(
-            "unrelated", "This is about machine learning"
-        )
-        assert 0.0 <= confidence <= 1.0
-
     def test_extract_section(self, llm_service):
         """Test section extraction from LLM response."""
         text = "TAGS: ai, ml, tech\nDESCRIPTION: About AI technology"
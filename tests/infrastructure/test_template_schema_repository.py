@@ -1,6 +1,5 @@
 """Tests for template schema repository."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -15,26 +14,8 @@ from src.knowledge_base_organizer.infrastructure.template_schema_repository impo
     TemplateSchemaRepository,
 )
 
-
-class TestTemplateSchemaRepository:
-    """Test template schema repository functionality."""
-
-    @pytest.fixture
-    def temp_vault(self):
-        """Create a temporary vault with template files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            vault_path = Path(temp_dir)
-
-            # Create template directories
-            template_dir = vault_path / "900_TemplaterNotes"
-            template_dir.mkdir()
-
-            book_template_dir = vault_path / "903_BookSearchTemplates"
-            book_template_dir.mkdir()
-
-            # Create fleeting note template
-            fleeting_template = template_dir / "new-fleeing-note.md"
-            fleeting_template.write_text("""---
+# Pre-encoded template bodies; the book template is UTF-8 encoded at import
+FLEETING_TEMPLATE = b"""---
 title: <% tp.file.cursor(1) %>
 aliases: []
 tags: []
@@ -47,11 +28,9 @@ description: ""
 
 # <% tp.file.cursor(2) %>
 
-""")
+"""
 
-            # Create book search template
-            book_template = book_template_dir / "booksearchtemplate.md"
-            book_template.write_text("""---
+BOOK_TEMPLATE = """---
 title: "{{title}}"
 author: "{{author}}"
 publisher: "{{publisher}}"
@@ -71,24 +50,55 @@ publish: false
 - ページ数: {{totalPage}}
 - ISBN: {{isbn13}}
 
-""")
+""".encode()
 
-            yield vault_path
 
-    @pytest.fixture
-    def config(self):
-        """Create test configuration."""
-        return ProcessingConfig.get_default_config()
+def _write_templates(vault_path: Path) -> Path:
+    """Create the template directories and files of a test vault."""
+    template_dir = vault_path / "900_TemplaterNotes"
+    template_dir.mkdir()
+    (template_dir / "new-fleeing-note.md").write_bytes(FLEETING_TEMPLATE)
 
-    @pytest.fixture
-    def repository(self, temp_vault, config):
-        """Create template schema repository."""
-        return TemplateSchemaRepository(temp_vault, config)
+    book_template_dir = vault_path / "903_BookSearchTemplates"
+    book_template_dir.mkdir()
+    (book_template_dir / "booksearchtemplate.md").write_bytes(BOOK_TEMPLATE)
+
+    return vault_path
 
-    def test_extract_schemas_from_templates(self, repository):
-        """Test extracting schemas from template files."""
-        schemas = repository.extract_schemas_from_templates()
 
+@pytest.fixture(scope="module")
+def temp_vault(tmp_path_factory):
+    """Create a temporary vault with template files, shared by the module.
+
+    Tests that write into the vault use their own copy instead, so this one
+    stays unchanged for every read-only test.
+    """
+    return _write_templates(tmp_path_factory.mktemp("vault"))
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Create test configuration."""
+    return ProcessingConfig.get_default_config()
+
+
+@pytest.fixture(scope="module")
+def repository(temp_vault, config):
+    """Create template schema repository."""
+    return TemplateSchemaRepository(temp_vault, config)
+
+
+@pytest.fixture(scope="module")
+def schemas(repository):
+    """Schemas extracted once from the shared vault's templates."""
+    return repository.extract_schemas_from_templates()
+
+
+class TestTemplateSchemaRepository:
+    """Test template schema repository functionality."""
+
+    def test_extract_schemas_from_templates(self, schemas):
+        """Test extracting schemas from template files."""
         assert len(schemas) == 2
         assert "new-fleeing-note" in schemas
         assert "booksearchtemplate" in schemas
@@ -144,53 +154,6 @@ publish: false
         # Check validation patterns
         assert schema.fields["isbn13"].validation_pattern == r"^\d{13}$"
 
-    def test_detect_template_type_by_directory(self, repository, temp_vault):
-        """Test template type detection by directory."""
-        # Create test files in different directories
-        fleeting_dir = temp_vault / "100_FleetingNotes"
-        fleeting_dir.mkdir()
-        fleeting_file = fleeting_dir / "test-note.md"
-        fleeting_file.write_text("---\ntitle: Test\n---\n# Test")
-
-        book_dir = temp_vault / "104_Books"
-        book_dir.mkdir()
-        book_file = book_dir / "test-book.md"
-        book_file.write_text("---\ntitle: Test Book\n---\n# Test Book")
-
-        # Create MarkdownFile objects
-        fleeting_md = MarkdownFile(
-            path=fleeting_file,
-            frontmatter=Frontmatter(title="Test"),
-            content="# Test",
-        )
-
-        book_md = MarkdownFile(
-            path=book_file,
-            frontmatter=Frontmatter(title="Test Book"),
-            content="# Test Book",
-        )
-
-        # Test detection
-        assert repository.detect_template_type(fleeting_md) == "new-fleeing-note"
-        assert repository.detect_template_type(book_md) == "booksearchtemplate"
-
-    def test_detect_template_type_by_content(self, repository, temp_vault):
-        """Test template type detection by content."""
-        # Create test file with book-specific frontmatter
-        test_file = temp_vault / "test-book.md"
-        test_file.write_text(
-            "---\ntitle: Test Book\nisbn13: '1234567890123'\n---\n# Test"
-        )
-
-        book_md = MarkdownFile(
-            path=test_file,
-            frontmatter=Frontmatter(title="Test Book", isbn13="1234567890123"),
-            content="# Test Book",
-        )
-
-        # Test detection
-        assert repository.detect_template_type(book_md) == "booksearchtemplate"
-
     def test_field_type_determination(self, repository):
         """Test field type determination logic."""
         # Test string field
@@ -255,9 +218,8 @@ publish: false
         pattern = repository._create_validation_pattern("title", FieldType.STRING)
         assert pattern is None
 
-    def test_schema_validation(self, repository):
+    def test_schema_validation(self, schemas):
         """Test schema validation functionality."""
-        schemas = repository.extract_schemas_from_templates()
         fleeting_schema = schemas["new-fleeing-note"]
 
         # Test valid frontmatter
@@ -287,21 +249,79 @@ publish: false
         assert result.is_valid is False
         assert "title" in result.missing_fields
 
-    def test_empty_vault(self, config):
+    def test_empty_vault(self, config, tmp_path):
         """Test behavior with empty vault."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            vault_path = Path(temp_dir)
-            repository = TemplateSchemaRepository(vault_path, config)
+        repository = TemplateSchemaRepository(tmp_path, config)
+
+        schemas = repository.extract_schemas_from_templates()
+        assert len(schemas) == 0
+
+
+class TestTemplateSchemaRepositoryVaultChanges:
+    """Template schema repository tests that write files into the vault."""
+
+    @pytest.fixture
+    def temp_vault(self, tmp_path):
+        """Create a temporary vault with template files for a single test."""
+        return _write_templates(tmp_path)
+
+    @pytest.fixture
+    def repository(self, temp_vault, config):
+        """Create template schema repository over this test's vault."""
+        return TemplateSchemaRepository(temp_vault, config)
+
+    def test_detect_template_type_by_directory(self, repository, temp_vault):
+        """Test template type detection by directory."""
+        # Create test files in different directories; MarkdownFile requires
+        # them to exist, but detection never reads their contents
+        fleeting_dir = temp_vault / "100_FleetingNotes"
+        fleeting_dir.mkdir()
+        fleeting_file = fleeting_dir / "test-note.md"
+        fleeting_file.touch()
+
+        book_dir = temp_vault / "104_Books"
+        book_dir.mkdir()
+        book_file = book_dir / "test-book.md"
+        book_file.touch()
 
-            schemas = repository.extract_schemas_from_templates()
-            assert len(schemas) == 0
+        # Create MarkdownFile objects
+        fleeting_md = MarkdownFile(
+            path=fleeting_file,
+            frontmatter=Frontmatter(title="Test"),
+            content="# Test",
+        )
+
+        book_md = MarkdownFile(
+            path=book_file,
+            frontmatter=Frontmatter(title="Test Book"),
+            content="# Test Book",
+        )
+
+        # Test detection
+        assert repository.detect_template_type(fleeting_md) == "new-fleeing-note"
+        assert repository.detect_template_type(book_md) == "booksearchtemplate"
+
+    def test_detect_template_type_by_content(self, repository, temp_vault):
+        """Test template type detection by content."""
+        # Create test file; detection uses the frontmatter passed in below
+        test_file = temp_vault / "test-book.md"
+        test_file.touch()
+
+        book_md = MarkdownFile(
+            path=test_file,
+            frontmatter=Frontmatter(title="Test Book", isbn13="1234567890123"),
+            content="# Test Book",
+        )
+
+        # Test detection
+        assert repository.detect_template_type(book_md) == "booksearchtemplate"
 
     def test_invalid_template_file(self, temp_vault, config):
         """Test handling of invalid template files."""
         # Create invalid template file
         template_dir = temp_vault / "900_TemplaterNotes"
         invalid_template = template_dir / "invalid-template.md"
-        invalid_template.write_text("This is not a valid template file")
+        invalid_template.write_bytes(b"This is not a valid template file")
 
         repository = TemplateSchemaRepository(temp_vault, config)
         schemas = repository.extract_schemas_from_templates()
@@ -1,38 +1,21 @@
 """End-to-end integration tests for AI-enhanced organize functionality."""
 
-import tempfile
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
 from knowledge_base_organizer.cli.organize_command import organize_command
 from knowledge_base_organizer.cli.summarize_command import summarize_command
 from knowledge_base_organizer.domain.services.ai_services import MetadataSuggestion
 
-
-class TestAIEnhancedOrganizeEndToEnd:
-    """End-to-end tests for AI-enhanced organize functionality."""
-
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        # Create temporary vault
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.vault_path = self.temp_dir / "test_vault"
-        self.vault_path.mkdir()
-
-        # Create test files with various content types
-        self._create_test_files()
-
-    def teardown_method(self) -> None:
-        """Clean up test environment."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
-    def _create_test_files(self) -> None:
-        """Create test files for AI enhancement testing."""
-        # Machine learning note
-        ml_note = self.vault_path / "machine_learning_basics.md"
-        ml_content = """---
+# Pre-encoded notes every test vault starts with, keyed by file name
+TEST_NOTES = {
+    # Machine learning note
+    "machine_learning_basics.md": b"""---
 title: Machine Learning Basics
 ---
 
@@ -54,12 +37,9 @@ on datasets to recognize patterns and make decisions.
 - Natural language processing and text analysis
 - Recommendation systems for e-commerce
 - Autonomous vehicles and robotics
-"""
-        ml_note.write_text(ml_content)
-
-        # Programming note
-        prog_note = self.vault_path / "python_programming.md"
-        prog_content = """---
+""",
+    # Programming note
+    "python_programming.md": b"""---
 title: Python Programming
 ---
 
@@ -82,112 +62,200 @@ artificial intelligence, and automation.
 - Pandas for data manipulation
 - Django for web development
 - TensorFlow for machine learning
-"""
-        prog_note.write_text(prog_content)
+""",
+}
+
+
+# Canned suggestions shared by every call; the organize flow only reads them
+ML_SUGGESTION = MetadataSuggestion(
+    suggested_tags=["machine-learning", "ai", "data-science"],
+    suggested_aliases=["ML Basics", "AI Fundamentals"],
+    suggested_description="Introduction to machine learning concepts and applications",
+    confidence_scores={"tags": 0.9, "aliases": 0.8, "description": 0.85},
+)
+PYTHON_SUGGESTION = MetadataSuggestion(
+    suggested_tags=["programming", "python", "development"],
+    suggested_aliases=["Python Guide", "Programming Tutorial"],
+    suggested_description="Comprehensive guide to Python programming",
+    confidence_scores={"tags": 0.6, "aliases": 0.5, "description": 0.7},
+)
+EMPTY_SUGGESTION = MetadataSuggestion(
+    suggested_tags=[],
+    suggested_aliases=[],
+    suggested_description="",
+    confidence_scores={"tags": 0.6, "aliases": 0.5, "description": 0.7},
+)
+INTEGRATION_SUGGESTION = MetadataSuggestion(
+    suggested_tags=["test", "integration"],
+    suggested_aliases=["Test Note"],
+    suggested_description="Test file for integration testing",
+    confidence_scores={"tags": 0.8, "aliases": 0.7, "description": 0.9},
+)
+CUSTOM_CONFIG_SUGGESTION = MetadataSuggestion(
+    suggested_tags=["custom", "config"],
+    suggested_aliases=["Custom Note"],
+    suggested_description="Note processed with custom AI configuration",
+    confidence_scores={"tags": 0.9, "aliases": 0.8, "description": 0.85},
+)
+ENHANCED_SUGGESTION = MetadataSuggestion(
+    suggested_tags=["enhanced", "ai-generated"],
+    suggested_aliases=["Enhanced Note"],
+    suggested_description="AI-enhanced note with additional metadata",
+    confidence_scores={"tags": 0.7, "aliases": 0.6, "description": 0.8},
+)
+SUGGESTIONS_BY_TOPIC = {
+    "machine learning": ML_SUGGESTION,
+    "python": PYTHON_SUGGESTION,
+}
+
+
+class FakeLLM:
+    """LLM service stand-in suggesting metadata based on the note's topic.
+
+    A fixed ``suggestion`` is returned for every note instead when given, and
+    ``error`` is raised from every suggestion call when given.
+    """
+
+    def __init__(
+        self,
+        suggestion: MetadataSuggestion | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self.calls = 0
+        self._suggestion = suggestion
+        self._error = error
+
+    def get_model_info(self) -> dict[str, str]:
+        return {"model_name": "fake-llm", "api_format": "fake"}
+
+    def suggest_metadata(
+        self, content: str, _current_frontmatter: dict
+    ) -> MetadataSuggestion:
+        self.calls += 1
+        if self._error is not None:
+            raise self._error
+        if self._suggestion is not None:
+            return self._suggestion
+        content = content.lower()
+        for topic, suggestion in SUGGESTIONS_BY_TOPIC.items():
+            if topic in content:
+                return suggestion
+        return EMPTY_SUGGESTION
+
+
+@pytest.fixture(scope="module")
+def shared_vault(fs_module: FakeFilesystem) -> Path:
+    """Test vault on an in-memory filesystem, built once for the module.
+
+    Tests that modify the vault must use ``writable_vault`` instead.
+    """
+    vault_path = Path("/test_vault")
+    for name, content in TEST_NOTES.items():
+        fs_module.create_file(vault_path / name, contents=content)
+    return vault_path
+
+
+@pytest.fixture
+def writable_vault(shared_vault: Path) -> Iterator[Path]:
+    """Private copy of the shared vault for tests that write to it."""
+    vault_path = shared_vault.with_name("writable_test_vault")
+    shutil.copytree(shared_vault, vault_path)
+    yield vault_path
+    shutil.rmtree(vault_path)
+
+
+@pytest.fixture(scope="module")
+def patched_create_llm() -> Iterator[Mock]:
+    """Patch the LLM service factory once for the whole module."""
+    with patch(
+        "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
+    ) as mock_create_llm:
+        yield mock_create_llm
 
-    def test_organize_command_ai_integration_dry_run(self) -> None:
-        """Test AI-enhanced organize command in dry-run mode."""
-        # Mock LLM service with realistic responses
-        mock_llm_service = Mock()
 
-        def mock_suggest_metadata(
-            content: str, current_frontmatter: dict
-        ) -> MetadataSuggestion:
-            if "machine learning" in content.lower():
-                return MetadataSuggestion(
-                    suggested_tags=["machine-learning", "ai", "data-science"],
-                    suggested_aliases=["ML Basics", "AI Fundamentals"],
-                    suggested_description="Introduction to machine learning concepts and applications",
-                    confidence_scores={
-                        "tags": 0.9,
-                        "aliases": 0.8,
-                        "description": 0.85,
-                    },
-                )
-            if "python" in content.lower():
-                return MetadataSuggestion(
-                    suggested_tags=["programming", "python", "development"],
-                    suggested_aliases=["Python Guide", "Programming Tutorial"],
-                    suggested_description="Comprehensive guide to Python programming",
-                    confidence_scores={"tags": 0.6, "aliases": 0.5, "description": 0.7},
-                )
-            return MetadataSuggestion(
-                suggested_tags=[],
-                suggested_aliases=[],
-                suggested_description="",
-                confidence_scores={"tags": 0.6, "aliases": 0.5, "description": 0.7},
-            )
-
-        mock_llm_service.suggest_metadata.side_effect = mock_suggest_metadata
-
-        with patch(
-            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-        ) as mock_create_llm:
-            mock_create_llm.return_value = mock_llm_service
-
-            # Run organize command with AI enabled
-            organize_command(
-                vault_path=self.vault_path,
-                dry_run=True,  # Dry run to avoid file modifications
-                interactive=False,
-                ai_suggest_metadata=True,
-                verbose=True,
-            )
-
-            # Verify LLM service was created and used
-            mock_create_llm.assert_called_once()
-            # Should have been called for each file
-            assert mock_llm_service.suggest_metadata.call_count >= 2
-
-    def test_organize_command_ai_integration_execute_mode(self) -> None:
+class TestAIEnhancedOrganizeEndToEnd:
+    """End-to-end tests for AI-enhanced organize functionality."""
+
+    @pytest.fixture
+    def mock_create_llm(self, patched_create_llm: Mock) -> Mock:
+        """Return the patched factory, cleared of earlier tests' calls and setup."""
+        patched_create_llm.reset_mock(return_value=True, side_effect=True)
+        return patched_create_llm
+
+    @pytest.fixture(autouse=True)
+    def _test_vault(self, shared_vault: Path) -> None:
+        """Point read-only tests at the module's shared vault."""
+        self.vault_path = shared_vault
+
+    @pytest.mark.parametrize(
+        ("fake_llm_kwargs", "create_error", "expected_min_calls"),
+        [
+            pytest.param({}, None, 2, id="topic_suggestions"),
+            pytest.param(
+                {"suggestion": CUSTOM_CONFIG_SUGGESTION},
+                None,
+                1,
+                id="custom_configuration",
+            ),
+            pytest.param(
+                {}, Exception("AI service unavailable"), 0, id="service_unavailable"
+            ),
+            pytest.param(
+                {"error": Exception("AI processing failed")},
+                None,
+                1,
+                id="suggestion_failure",
+            ),
+        ],
+    )
+    def test_organize_command_ai_integration_dry_run(
+        self,
+        mock_create_llm: Mock,
+        fake_llm_kwargs: dict,
+        create_error: Exception | None,
+        expected_min_calls: int,
+    ) -> None:
+        """Test AI-enhanced organize dry run, falling back when AI services fail."""
+        fake_llm = FakeLLM(**fake_llm_kwargs)
+        mock_create_llm.return_value = fake_llm
+        mock_create_llm.side_effect = create_error
+
+        # Should not raise even when the AI service fails; it continues without AI
+        organize_command(
+            vault_path=self.vault_path,
+            dry_run=True,  # Dry run to avoid file modifications
+            interactive=False,
+            ai_suggest_metadata=True,
+            verbose=True,
+        )
+
+        # Verify LLM service creation was attempted and suggestions requested
+        assert mock_create_llm.call_count == 1
+        assert fake_llm.calls >= expected_min_calls
+
+    def test_organize_command_ai_integration_execute_mode(
+        self, mock_create_llm: Mock, writable_vault: Path
+    ) -> None:
         """Test AI-enhanced organize command in execute mode."""
         # Mock LLM service
         mock_llm_service = Mock()
-        mock_llm_service.suggest_metadata.return_value = MetadataSuggestion(
-            suggested_tags=["test", "integration"],
-            suggested_aliases=["Test Note"],
-            suggested_description="Test file for integration testing",
-            confidence_scores={"tags": 0.8, "aliases": 0.7, "description": 0.9},
+        mock_llm_service.suggest_metadata.return_value = INTEGRATION_SUGGESTION
+
+        mock_create_llm.return_value = mock_llm_service
+
+        # Run organize command in execute mode
+        organize_command(
+            vault_path=writable_vault,
+            dry_run=False,  # Execute mode
+            interactive=False,
+            ai_suggest_metadata=True,
+            verbose=False,
         )
 
-        with patch(
-            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-        ) as mock_create_llm:
-            mock_create_llm.return_value = mock_llm_service
-
-            # Run organize command in execute mode
-            organize_command(
-                vault_path=self.vault_path,
-                dry_run=False,  # Execute mode
-                interactive=False,
-                ai_suggest_metadata=True,
-                verbose=False,
-            )
-
-            # Verify LLM service was created
-            mock_create_llm.assert_called_once()
-
-    def test_organize_command_fallback_without_ai(self) -> None:
-        """Test organize command fallback when AI service is unavailable."""
-        with patch(
-            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-        ) as mock_create_llm:
-            # Make LLM service creation fail
-            mock_create_llm.side_effect = Exception("AI service unavailable")
-
-            # Should not raise exception, just continue without AI
-            organize_command(
-                vault_path=self.vault_path,
-                dry_run=True,
-                interactive=False,
-                ai_suggest_metadata=True,  # AI requested but will fail
-                verbose=False,
-            )
-
-            # Verify LLM service creation was attempted
-            mock_create_llm.assert_called_once()
-
-    def test_summarize_command_integration(self) -> None:
+        # Verify LLM service was created
+        assert mock_create_llm.call_count == 1
+
+    def test_summarize_command_integration(self, mock_create_llm: Mock) -> None:
         """Test AI-enhanced summarize command integration."""
         # Select a test file for summarization
         test_file = self.vault_path / "machine_learning_basics.md"
@@ -200,28 +268,27 @@ artificial intelligence, and automation.
             "画像認識、自然言語処理、推薦システムなど様々な分野で応用されています。"
         )
 
-        with patch(
-            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-        ) as mock_create_llm:
-            mock_create_llm.return_value = mock_llm_service
+        mock_create_llm.return_value = mock_llm_service
 
-            # Run summarize command
-            summarize_command(
-                file_path=test_file,
-                max_length=200,
-                output=None,
-                verbose=True,
-            )
+        # Run summarize command
+        summarize_command(
+            file_path=test_file,
+            max_length=200,
+            output_file=None,
+            verbose=True,
+        )
 
-            # Verify LLM service was created and used
-            mock_create_llm.assert_called_once()
-            mock_llm_service.summarize_content.assert_called_once()
+        # Verify LLM service was created and used
+        assert mock_create_llm.call_count == 1
+        assert mock_llm_service.summarize_content.call_count == 1
 
-    def test_summarize_command_with_output_file(self) -> None:
+    def test_summarize_command_with_output_file(
+        self, mock_create_llm: Mock, writable_vault: Path
+    ) -> None:
         """Test summarize command with output file."""
         # Select a test file for summarization
-        test_file = self.vault_path / "python_programming.md"
-        output_file = self.vault_path / "python_summary.md"
+        test_file = writable_vault / "python_programming.md"
+        output_file = writable_vault / "python_summary.md"
 
         # Mock LLM service
         mock_llm_service = Mock()
@@ -230,87 +297,35 @@ artificial intelligence, and automation.
             "ウェブ開発、データサイエンス、AI分野で広く使用されています。"
         )
 
-        with patch(
-            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-        ) as mock_create_llm:
-            mock_create_llm.return_value = mock_llm_service
-
-            # Run summarize command with output file
-            summarize_command(
-                file_path=test_file,
-                max_length=150,
-                output=output_file,
-                verbose=False,
-            )
-
-            # Verify output file was created
-            assert output_file.exists()
-            summary_content = output_file.read_text()
-            assert "Python" in summary_content
-
-            # Verify LLM service was used
-            mock_create_llm.assert_called_once()
-            mock_llm_service.summarize_content.assert_called_once()
-
-    def test_ai_services_error_handling(self) -> None:
-        """Test error handling when AI services encounter issues."""
-        # Mock LLM service that raises exceptions
-        mock_llm_service = Mock()
-        mock_llm_service.suggest_metadata.side_effect = Exception(
-            "AI processing failed"
-        )
+        mock_create_llm.return_value = mock_llm_service
 
-        with patch(
-            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-        ) as mock_create_llm:
-            mock_create_llm.return_value = mock_llm_service
-
-            # Should handle AI errors gracefully
-            organize_command(
-                vault_path=self.vault_path,
-                dry_run=True,
-                interactive=False,
-                ai_suggest_metadata=True,
-                verbose=False,
-            )
-
-            # Verify LLM service was created
-            mock_create_llm.assert_called_once()
-
-    def test_ai_configuration_integration(self) -> None:
-        """Test AI functionality with different configuration scenarios."""
-        # Test with custom LLM configuration
-        mock_llm_service = Mock()
-        mock_llm_service.suggest_metadata.return_value = MetadataSuggestion(
-            suggested_tags=["custom", "config"],
-            suggested_aliases=["Custom Note"],
-            suggested_description="Note processed with custom AI configuration",
-            confidence_scores={"tags": 0.9, "aliases": 0.8, "description": 0.85},
+        # Run summarize command with output file
+        summarize_command(
+            file_path=test_file,
+            max_length=150,
+            output_file=output_file,
+            verbose=False,
         )
 
-        with patch(
-            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-        ) as mock_create_llm:
-            mock_create_llm.return_value = mock_llm_service
-
-            # Run with AI enabled
-            organize_command(
-                vault_path=self.vault_path,
-                dry_run=True,
-                interactive=False,
-                ai_suggest_metadata=True,
-                verbose=True,
-            )
-
-            # Verify service creation and usage
-            mock_create_llm.assert_called_once()
-            assert mock_llm_service.suggest_metadata.call_count >= 1
-
-    def test_mixed_ai_and_traditional_processing(self) -> None:
+        # Verify output file was created
+        assert output_file.exists()
+        # Split the saved file once and check its structure line by line
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "# Summary of python_programming.md"
+        summary_line = lines[lines.index("## Summary") + 2]
+        assert summary_line.startswith("Python")
+
+        # Verify LLM service was used
+        assert mock_create_llm.call_count == 1
+        assert mock_llm_service.summarize_content.call_count == 1
+
+    def test_mixed_ai_and_traditional_processing(
+        self, mock_create_llm: Mock, writable_vault: Path
+    ) -> None:
         """Test combination of AI-enhanced and traditional processing."""
         # Create files with and without existing metadata
-        basic_file = self.vault_path / "basic_note.md"
-        basic_content = """---
+        basic_file = writable_vault / "basic_note.md"
+        basic_content = b"""---
 title: Basic Note
 tags: [existing, manual]
 ---
@@ -319,32 +334,24 @@ tags: [existing, manual]
 
 This is a simple note with existing metadata.
 """
-        basic_file.write_text(basic_content)
+        basic_file.write_bytes(basic_content)
 
         # Mock LLM service
         mock_llm_service = Mock()
-        mock_llm_service.suggest_metadata.return_value = MetadataSuggestion(
-            suggested_tags=["enhanced", "ai-generated"],
-            suggested_aliases=["Enhanced Note"],
-            suggested_description="AI-enhanced note with additional metadata",
-            confidence_scores={"tags": 0.7, "aliases": 0.6, "description": 0.8},
+        mock_llm_service.suggest_metadata.return_value = ENHANCED_SUGGESTION
+
+        mock_create_llm.return_value = mock_llm_service
+
+        # Run organize command
+        organize_command(
+            vault_path=writable_vault,
+            dry_run=True,
+            interactive=False,
+            ai_suggest_metadata=True,
+            verbose=True,
         )
 
-        with patch(
-            "knowledge_base_organizer.infrastructure.llm_factory.create_llm_service"
-        ) as mock_create_llm:
-            mock_create_llm.return_value = mock_llm_service
-
-            # Run organize command
-            organize_command(
-                vault_path=self.vault_path,
-                dry_run=True,
-                interactive=False,
-                ai_suggest_metadata=True,
-                verbose=True,
-            )
-
-            # Verify AI service was used
-            mock_create_llm.assert_called_once()
-            # Should process all files, including those with existing metadata
-            assert mock_llm_service.suggest_metadata.call_count >= 3
+        # Verify AI service was used
+        assert mock_create_llm.call_count == 1
+        # Should process all files, including those with existing metadata
+        assert mock_llm_service.suggest_metadata.call_count >= 3
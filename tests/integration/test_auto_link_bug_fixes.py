@@ -6,9 +6,7 @@ This test addresses the issues described in FIX_AUTO_LINK.md:
 - Destruction of HTML links
 """
 
-import shutil
-import tempfile
-from pathlib import Path
+import re
 
 import pytest
 
@@ -25,16 +23,42 @@ from knowledge_base_organizer.domain.services.link_analysis_service import (
 from knowledge_base_organizer.infrastructure.config import ProcessingConfig
 from knowledge_base_organizer.infrastructure.file_repository import FileRepository
 
+# Every snippet the bug-fix checks look for, matched in a single scan of the
+# note's raw UTF-8 bytes
+SOURCE_NOTE_SNIPPETS_RE = re.compile(
+    rb"title: Source Note"
+    rb"|id: '?20251012100000'?"
+    rb"|# \[\[20251012100000\|Source Note\]\]"
+    rb"|# Source Note"
+    rb'|<a href="https://example\.com">Example Link</a>'
+    rb"|This note talks about a \[\[20251012100100\|Target Note\]\]\."
+)
+
+
+def _snippet_pattern(*snippets):
+    """Compile one alternation finding any of the bytes ``snippets`` in a single scan.
+
+    Longer snippets are tried first; the snippets must not overlap in the text.
+    """
+    alternatives = sorted(snippets, key=len, reverse=True)
+    return re.compile(b"|".join(map(re.escape, alternatives)))
+
+
+def _frontmatter_block(content):
+    """Return the bytes between the first two ``---`` delimiter lines."""
+    start = content.index(b"---\n") + len(b"---\n")
+    return content[start : content.index(b"---\n", start)]
 
-@pytest.fixture
-def bug_test_vault_path():
-    """Create a temporary vault with specific content to test bug fixes."""
-    temp_dir = tempfile.mkdtemp()
-    vault_path = Path(temp_dir) / "bug_vault"
-    vault_path.mkdir()
 
+def _write_vault(vault_path, files):
+    """Write each pre-encoded note in ``files`` (name -> bytes) into the vault."""
+    for name, content in files.items():
+        (vault_path / name).write_bytes(content)
+
+
+BUG_VAULT_NOTES = {
     # File to be processed
-    source_content = """---
+    "source.md": b"""---
 title: Source Note
 aliases: [Source]
 tags: [test, bug]
@@ -46,10 +70,9 @@ id: '20251012100000'
 This note talks about a Target Note.
 
 It also contains an HTML link that should be preserved: <a href="https://example.com">Example Link</a>.
-"""
-
+""",
     # File to be linked to
-    target_content = """---
+    "target.md": b"""---
 title: Target Note
 aliases: [Target]
 tags: [test, target]
@@ -59,24 +82,34 @@ id: '20251012100100'
 # Target Note
 
 This is the target.
-"""
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def bug_test_vault_path(tmp_path_factory):
+    """Create a temporary vault with specific content to test bug fixes."""
+    vault_path = tmp_path_factory.mktemp("bug_vault")
 
-    (vault_path / "source.md").write_text(source_content, encoding="utf-8")
-    (vault_path / "target.md").write_text(target_content, encoding="utf-8")
+    _write_vault(vault_path, BUG_VAULT_NOTES)
 
-    yield vault_path
-    shutil.rmtree(temp_dir)
+    return vault_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
     """Processing configuration for testing."""
     return ProcessingConfig.get_default_config()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auto_link_use_case(config):
-    """Auto-link generation use case with dependencies."""
+    """Auto-link generation use case with dependencies.
+
+    One instance is shared by every test: execute() only reconfigures the
+    services from request options these tests leave at their defaults, and
+    each test passes its own vault via the request.
+    """
     file_repository = FileRepository(config)
     link_analysis_service = LinkAnalysisService(config_dir=None)
     content_processing_service = ContentProcessingService()
@@ -89,77 +122,83 @@ def auto_link_use_case(config):
     )
 
 
-def test_auto_link_bug_fixes(auto_link_use_case, bug_test_vault_path):
+@pytest.fixture(scope="module")
+def bug_fix_run(auto_link_use_case, bug_test_vault_path):
+    """Auto-link the bug vault once; return the result and modified source note."""
+    source_file_path = bug_test_vault_path / "source.md"
+
+    request = AutoLinkGenerationRequest(
+        vault_path=bug_test_vault_path,
+        dry_run=False,
+    )
+    result = auto_link_use_case.execute(request)
+
+    modified_content = source_file_path.read_bytes()
+    return result, modified_content
+
+
+def test_auto_link_bug_fixes_run(bug_fix_run):
+    """Verify that auto-linking the bug vault succeeds with a single link."""
+    result, _modified_content = bug_fix_run
+
+    assert not result.errors, f"Execution failed with errors: {result.errors}"
+    assert result.total_links_created == 1
+
+
+def _check_frontmatter_preserved(content, found):
+    assert content.startswith(b"---"), "Frontmatter block was deleted."
+    assert b"title: Source Note" in found, "Frontmatter content was lost."
+    assert found & {b"id: 20251012100000", b"id: '20251012100000'"}, (
+        "Frontmatter content was lost."
+    )
+
+
+def _check_h1_not_linked(_content, found):
+    assert b"# Source Note" in found, "H1 header was incorrectly modified."
+    assert b"# [[20251012100000|Source Note]]" not in found, (
+        "H1 header was incorrectly linked."
+    )
+
+
+def _check_html_link_preserved(_content, found):
+    assert b'<a href="https://example.com">Example Link</a>' in found, (
+        "HTML link was broken."
+    )
+
+
+def _check_alias_link_created(_content, found):
+    expected_link = b"[[20251012100100|Target Note]]"  # Alias is now always included
+    assert b"This note talks about a " + expected_link + b"." in found, (
+        "The correct link was not created."
+    )
+
+
+@pytest.mark.parametrize(
+    "check",
+    [
+        _check_frontmatter_preserved,
+        _check_h1_not_linked,
+        _check_html_link_preserved,
+        _check_alias_link_created,
+    ],
+    ids=[
+        "frontmatter_preserved",
+        "h1_not_linked",
+        "html_link_preserved",
+        "alias_link_created",
+    ],
+)
+def test_auto_link_bug_fixes(bug_fix_run, check):
     """
     Verify that auto-linking does not delete frontmatter, link H1s, or break HTML.
     """
-    source_file_path = bug_test_vault_path / "source.md"
-    original_content = source_file_path.read_text(encoding="utf-8")
-
-    try:
-        request = AutoLinkGenerationRequest(
-            vault_path=bug_test_vault_path,
-            dry_run=False,
-        )
-
-        # Execute the use case
-        result = auto_link_use_case.execute(request)
-
-        # Verify execution was successful
-        assert not result.errors, f"Execution failed with errors: {result.errors}"
-        assert result.total_links_created == 1
-
-        # Read the modified content
-        modified_content = source_file_path.read_text(encoding="utf-8")
-
-        # 1. Verify Frontmatter is preserved
-        assert modified_content.startswith("---"), "Frontmatter block was deleted."
-        assert "title: Source Note" in modified_content, "Frontmatter content was lost."
-        assert (
-            "id: 20251012100000" in modified_content
-            or "id: '20251012100000'" in modified_content
-        ), "Frontmatter content was lost."
-
-        # 2. Verify H1 header is not linked
-        assert "# Source Note" in modified_content, (
-            "H1 header was incorrectly modified."
-        )
-        assert "# [[20251012100000|Source Note]]" not in modified_content, (
-            "H1 header was incorrectly linked."
-        )
-
-        # 3. Verify HTML link is preserved
-        assert '<a href="https://example.com">Example Link</a>' in modified_content, (
-            "HTML link was broken."
-        )
-
-        # 4. Verify the intended link was created with alias
-        expected_link = "[[20251012100100|Target Note]]"  # Alias is now always included
-        assert f"This note talks about a {expected_link}." in modified_content, (
-            "The correct link was not created."
-        )
-
-        # 5. Verify original content is different
-        assert original_content != modified_content
-
-    finally:
-        # Print the content of the file for debugging, even if tests fail
-        if source_file_path.exists():
-            modified_content_for_debug = source_file_path.read_text(encoding="utf-8")
-            print("\n--- Modified Content ---")
-            print(modified_content_for_debug)
-            print("--- End Modified Content ---")
-
-
-@pytest.fixture
-def frontmatter_protection_vault_path():
-    """Create a temporary vault to test frontmatter protection."""
-    temp_dir = tempfile.mkdtemp()
-    vault_path = Path(temp_dir) / "frontmatter_vault"
-    vault_path.mkdir()
+    _result, modified_content = bug_fix_run
+    check(modified_content, set(SOURCE_NOTE_SNIPPETS_RE.findall(modified_content)))
 
+
+FRONTMATTER_PROTECTION_VAULT_NOTES = {
     # File with specific frontmatter formatting that should be preserved
-    source_content = """---
+    "source.md": b"""---
 title: Test Frontmatter Protection
 image: "../../assets/images/svg/undraw/undraw_scrum_board.svg"
 tags: [tag1,tag2]
@@ -170,10 +209,9 @@ publish: false
 # Test Frontmatter Protection
 
 This file mentions Amazon API Gateway which should be linked.
-"""
-
+""",
     # Target file
-    target_content = """---
+    "target.md": b"""---
 title: Amazon API Gateway
 id: 20230730200042
 tags: [aws, api]
@@ -182,73 +220,13 @@ tags: [aws, api]
 # Amazon API Gateway
 
 Amazon API Gateway is a fully managed service.
-"""
+""",
+}
 
-    (vault_path / "source.md").write_text(source_content, encoding="utf-8")
-    (vault_path / "target.md").write_text(target_content, encoding="utf-8")
-
-    yield vault_path
-    shutil.rmtree(temp_dir)
-
-
-def test_frontmatter_protection(auto_link_use_case, frontmatter_protection_vault_path):
-    """Test that frontmatter formatting is preserved during auto-link processing."""
-    source_file_path = frontmatter_protection_vault_path / "source.md"
-    original_content = source_file_path.read_text(encoding="utf-8")
-
-    request = AutoLinkGenerationRequest(
-        vault_path=frontmatter_protection_vault_path,
-        dry_run=False,
-    )
-
-    # Execute the use case
-    result = auto_link_use_case.execute(request)
-
-    # Verify execution was successful
-    assert not result.errors, f"Execution failed with errors: {result.errors}"
-    assert result.total_links_created == 1
-
-    # Read the modified content
-    modified_content = source_file_path.read_text(encoding="utf-8")
-
-    # Extract frontmatter sections for comparison
-    original_fm = original_content.split("---\n")[1]
-    modified_fm = modified_content.split("---\n")[1]
-
-    # Verify frontmatter formatting is preserved
-    assert original_fm == modified_fm, (
-        f"Frontmatter formatting was changed:\n"
-        f"Original:\n{original_fm}\n"
-        f"Modified:\n{modified_fm}"
-    )
-
-    # Verify specific formatting elements are preserved
-    assert (
-        'image: "../../assets/images/svg/undraw/undraw_scrum_board.svg"'
-        in modified_content
-    ), "Double quotes in image field were not preserved"
-    assert "tags: [tag1,tag2]" in modified_content, (
-        "Inline array format was not preserved"
-    )
-    assert "id: 20240913221802" in modified_content, (
-        "Numeric ID format was not preserved"
-    )
-
-    # Verify the link was created with proper alias
-    assert "[[20230730200042|Amazon API Gateway]]" in modified_content, (
-        "Link was not created with proper alias"
-    )
-
-
-@pytest.fixture
-def lrd_exclusion_vault_path():
-    """Create a temporary vault to test LRD exclusion."""
-    temp_dir = tempfile.mkdtemp()
-    vault_path = Path(temp_dir) / "lrd_vault"
-    vault_path.mkdir()
 
+LRD_EXCLUSION_VAULT_NOTES = {
     # File with Link Reference Definitions that should be excluded
-    source_content = """---
+    "source.md": b"""---
 title: Test LRD Exclusion
 id: 20250123000001
 tags: [test, lrd]
@@ -265,10 +243,9 @@ It also mentions EC2 and ELB which should NOT be linked because they appear in L
 [20230727234718|EC2]: 20230727234718 "Amazon Elastic Compute Cloud (Amazon EC2)"
 [20230730201034|ELB]: 20230730201034 "Elastic Load Balancing"
 [20230802000730|RDS]: 20230802000730 "Amazon Relational Database Service (Amazon RDS)"
-"""
-
+""",
     # Target files
-    api_gateway_content = """---
+    "api_gateway.md": b"""---
 title: Amazon API Gateway
 id: 20230730200042
 tags: [aws, api]
@@ -277,9 +254,8 @@ tags: [aws, api]
 # Amazon API Gateway
 
 Amazon API Gateway is a fully managed service.
-"""
-
-    ec2_content = """---
+""",
+    "ec2.md": b"""---
 title: Amazon Elastic Compute Cloud (Amazon EC2)
 aliases: [EC2, Amazon EC2]
 id: 20230727234718
@@ -289,75 +265,14 @@ tags: [aws, compute]
 # Amazon Elastic Compute Cloud (Amazon EC2)
 
 Amazon EC2 provides scalable computing capacity.
-"""
-
-    (vault_path / "source.md").write_text(source_content, encoding="utf-8")
-    (vault_path / "api_gateway.md").write_text(api_gateway_content, encoding="utf-8")
-    (vault_path / "ec2.md").write_text(ec2_content, encoding="utf-8")
-
-    yield vault_path
-    shutil.rmtree(temp_dir)
-
-
-def test_lrd_exclusion(auto_link_use_case, lrd_exclusion_vault_path):
-    """Test that text in Link Reference Definitions is not converted to WikiLinks."""
-    source_file_path = lrd_exclusion_vault_path / "source.md"
-
-    request = AutoLinkGenerationRequest(
-        vault_path=lrd_exclusion_vault_path,
-        dry_run=False,
-    )
-
-    # Execute the use case
-    result = auto_link_use_case.execute(request)
-
-    # Verify execution was successful
-    assert not result.errors, f"Execution failed with errors: {result.errors}"
-    assert (
-        result.total_links_created == 2
-    )  # Amazon API Gateway and EC2 in body text should be linked
-
-    # Read the modified content
-    modified_content = source_file_path.read_text(encoding="utf-8")
-
-    # Verify Amazon API Gateway was linked
-    assert "[[20230730200042|Amazon API Gateway]]" in modified_content, (
-        "Amazon API Gateway should be linked"
-    )
+""",
+}
 
-    # Verify EC2 in body text was linked (this is correct behavior)
-    assert "It also mentions [[20230727234718|EC2]] and ELB" in modified_content, (
-        "EC2 in body text should be linked"
-    )
-
-    # Verify LRDs themselves are preserved and NOT modified
-    assert "[20230727234718|EC2]: 20230727234718" in modified_content, (
-        "LRD should be preserved exactly as is"
-    )
-    assert "[20230730201034|ELB]: 20230730201034" in modified_content, (
-        "LRD should be preserved exactly as is"
-    )
-
-    # Most importantly: verify LRD content was NOT converted to WikiLinks
-    assert (
-        "[20230727234718|[[20230727234718|EC2]]]: 20230727234718"
-        not in modified_content
-    ), "LRD content should NOT be converted to WikiLinks"
-    assert (
-        "Amazon Elastic Compute Cloud ([[20230727234718|Amazon EC2]])"
-        not in modified_content
-    ), "LRD title should NOT be converted to WikiLinks"
-
-
-@pytest.fixture
-def external_link_protection_vault_path():
-    """Create a temporary vault to test external link protection."""
-    temp_dir = tempfile.mkdtemp()
-    vault_path = Path(temp_dir) / "external_link_vault"
-    vault_path.mkdir()
 
+# The source note contains Japanese text, so it is UTF-8 encoded at import
+EXTERNAL_LINK_PROTECTION_VAULT_NOTES = {
     # File with external links that should be protected
-    source_content = """---
+    "source.md": """---
 title: Test External Link Protection
 id: 20250123000002
 tags: [test, external]
@@ -374,10 +289,9 @@ And this regular external link should also be protected:
 [AWS Organizations Documentation](https://docs.aws.amazon.com/organizations/)
 
 Organizations is mentioned again here and should be linked.
-"""
-
+""".encode(),
     # Target file
-    organizations_content = """---
+    "organizations.md": b"""---
 title: AWS Organizations
 aliases: [Organizations, AWS Organizations]
 id: 20230709211042
@@ -387,65 +301,118 @@ tags: [aws, management]
 # AWS Organizations
 
 AWS Organizations is a service for managing multiple AWS accounts.
-"""
+""",
+}
 
-    (vault_path / "source.md").write_text(source_content, encoding="utf-8")
-    (vault_path / "organizations.md").write_text(
-        organizations_content, encoding="utf-8"
-    )
 
-    yield vault_path
-    shutil.rmtree(temp_dir)
+CLOUDWATCH_EXTERNAL_LINK = (
+    "[[Organizations]CloudWatchを別アカウントに共有する際にOrganization account selectorを使ってみた"
+    " | DevelopersIO](https://dev.classmethod.jp/articles/cloudwatch-organizations-selector/)"
+)
+AWS_DOCS_EXTERNAL_LINK = (
+    "[AWS Organizations Documentation](https://docs.aws.amazon.com/organizations/)"
+)
 
 
-def test_external_link_protection(
-    auto_link_use_case, external_link_protection_vault_path
-):
-    """Test that text within external links is not converted to WikiLinks."""
-    source_file_path = external_link_protection_vault_path / "source.md"
+def _protection_case(notes, links_created, must_contain, must_not_contain, case_id):
+    """Table row for test_auto_link_protection with its snippet scan precompiled.
 
-    request = AutoLinkGenerationRequest(
-        vault_path=external_link_protection_vault_path,
-        dry_run=False,
+    Snippets are UTF-8 encoded here, once, to match against the note's raw bytes.
+    """
+    must_contain = tuple(snippet.encode() for snippet in must_contain)
+    must_not_contain = tuple(snippet.encode() for snippet in must_not_contain)
+    pattern = _snippet_pattern(*must_contain, *must_not_contain)
+    return pytest.param(
+        notes, links_created, must_contain, must_not_contain, pattern, id=case_id
     )
 
-    # Execute the use case
-    result = auto_link_use_case.execute(request)
+
+PROTECTION_CASES = [
+    _protection_case(
+        FRONTMATTER_PROTECTION_VAULT_NOTES,
+        1,
+        must_contain=(
+            # Double quotes, inline arrays and numeric ids keep their formatting
+            'image: "../../assets/images/svg/undraw/undraw_scrum_board.svg"',
+            "tags: [tag1,tag2]",
+            "id: 20240913221802",
+            # The link is created with its alias
+            "[[20230730200042|Amazon API Gateway]]",
+        ),
+        must_not_contain=(),
+        case_id="frontmatter_protection",
+    ),
+    _protection_case(
+        LRD_EXCLUSION_VAULT_NOTES,
+        2,  # Amazon API Gateway and EC2 in body text should be linked
+        must_contain=(
+            "[[20230730200042|Amazon API Gateway]]",
+            "It also mentions [[20230727234718|EC2]] and ELB",
+            # LRDs themselves are preserved exactly as is
+            "[20230727234718|EC2]: 20230727234718",
+            "[20230730201034|ELB]: 20230730201034",
+        ),
+        must_not_contain=(
+            # LRD content and titles are NOT converted to WikiLinks
+            "[20230727234718|[[20230727234718|EC2]]]: 20230727234718",
+            "Amazon Elastic Compute Cloud ([[20230727234718|Amazon EC2]])",
+        ),
+        case_id="lrd_exclusion",
+    ),
+    _protection_case(
+        EXTERNAL_LINK_PROTECTION_VAULT_NOTES,
+        2,  # Two mentions of Organizations in body text should be linked
+        must_contain=(
+            "This file mentions [[20230709211042|Organizations]]",
+            "[[20230709211042|Organizations]] is mentioned again",
+            # External links are preserved exactly
+            CLOUDWATCH_EXTERNAL_LINK,
+            AWS_DOCS_EXTERNAL_LINK,
+        ),
+        must_not_contain=(
+            # Organizations within external links is NOT converted
+            "[[[[20230709211042|Organizations]]]CloudWatchを別アカウントに",
+            "[[[20230709211042|AWS Organizations]] Documentation]",
+        ),
+        case_id="external_link_protection",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("notes", "links_created", "must_contain", "must_not_contain", "pattern"),
+    PROTECTION_CASES,
+)
+def test_auto_link_protection(
+    auto_link_use_case,
+    tmp_path,
+    notes,
+    links_created,
+    must_contain,
+    must_not_contain,
+    pattern,
+):
+    """Test that auto-linking leaves frontmatter, LRDs and external links intact."""
+    _write_vault(tmp_path, notes)
+
+    result = auto_link_use_case.execute(
+        AutoLinkGenerationRequest(vault_path=tmp_path, dry_run=False)
+    )
 
     # Verify execution was successful
     assert not result.errors, f"Execution failed with errors: {result.errors}"
-    assert (
-        result.total_links_created == 2
-    )  # Two mentions of Organizations in body text should be linked
+    assert result.total_links_created == links_created
 
-    # Read the modified content
-    modified_content = source_file_path.read_text(encoding="utf-8")
+    modified_content = (tmp_path / "source.md").read_bytes()
 
-    # Verify Organizations in body text was linked
-    assert "This file mentions [[20230709211042|Organizations]]" in modified_content, (
-        "Organizations in body text should be linked"
-    )
-    assert "[[20230709211042|Organizations]] is mentioned again" in modified_content, (
-        "Second mention of Organizations should be linked"
+    # Verify frontmatter formatting is preserved
+    original_fm = _frontmatter_block(notes["source.md"])
+    assert _frontmatter_block(modified_content) == original_fm, (
+        "Frontmatter formatting was changed"
     )
 
-    # Most importantly: verify external links are preserved and NOT modified
-    assert (
-        "[[Organizations]CloudWatchを別アカウントに共有する際にOrganization account selectorを使ってみた | DevelopersIO](https://dev.classmethod.jp/articles/cloudwatch-organizations-selector/)"
-        in modified_content
-    ), "External link with Organizations in text should be preserved exactly"
-
-    assert (
-        "[AWS Organizations Documentation](https://docs.aws.amazon.com/organizations/)"
-        in modified_content
-    ), "Regular external link should be preserved exactly"
-
-    # Verify that Organizations within external links was NOT converted
-    assert (
-        "[[[[20230709211042|Organizations]]]CloudWatchを別アカウントに"
-        not in modified_content
-    ), "Organizations within external link should NOT be converted to WikiLink"
-
-    assert (
-        "[[[20230709211042|AWS Organizations]] Documentation]" not in modified_content
-    ), "Organizations within regular external link should NOT be converted"
+    found = set(pattern.findall(modified_content))
+    missing = [snippet.decode() for snippet in must_contain if snippet not in found]
+    assert not missing, f"Expected text was not found: {missing}"
+    unexpected = [snippet.decode() for snippet in must_not_contain if snippet in found]
+    assert not unexpected, f"Text should not have been linked: {unexpected}"
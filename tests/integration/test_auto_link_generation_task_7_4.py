@@ -8,9 +8,9 @@ This test implements the requirements for task 7.4:
 """
 
 import json
+import os
 import re
 import shutil
-import tempfile
 import time
 from pathlib import Path
 
@@ -29,23 +29,75 @@ from knowledge_base_organizer.domain.services.link_analysis_service import (
 from knowledge_base_organizer.infrastructure.config import ProcessingConfig
 from knowledge_base_organizer.infrastructure.file_repository import FileRepository
 
+WIKILINK_RE = re.compile(r"\[\[([^\]]+)\]\]")
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+def _slurp(path: Path) -> str:
+    """Read a whole note with a single read() sized from fstat."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size).decode("utf-8")
+    finally:
+        os.close(fd)
+
+
+def _read_notes(vault_path: Path) -> dict[Path, str]:
+    """Read every markdown note in the vault in a single pass."""
+    # Serial on purpose: a thread pool was ~3x slower on test-myvault's few
+    # dozen small notes
+    return {
+        md_file: _slurp(md_file)
+        for md_file in vault_path.rglob("*.md")
+        if md_file.is_file()
+    }
+
 
 class TestAutoLinkGenerationTask74:
     """Test basic auto-linking functionality with real vault data."""
 
-    @pytest.fixture
-    def test_vault_path(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def test_vault_path(cls):
         """Path to test-myvault data."""
         return Path("tests/test-data/vaults/test-myvault")
 
-    @pytest.fixture
-    def temp_vault_path(self, test_vault_path):
-        """Create a temporary copy of test-myvault for testing."""
-        temp_dir = tempfile.mkdtemp()
-        temp_vault = Path(temp_dir) / "test-vault"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def _class_vault(cls, tmp_path_factory, test_vault_path):
+        """Copy test-myvault once per class and remember its original bytes."""
+        temp_vault = tmp_path_factory.mktemp("task_7_4") / "test-vault"
         shutil.copytree(test_vault_path, temp_vault)
+        originals = {
+            path.relative_to(temp_vault): path.read_bytes()
+            for path in temp_vault.rglob("*")
+            if path.is_file()
+        }
+        return temp_vault, originals
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def pristine_notes(cls, _class_vault):
+        """Original content of every note in the shared vault, read once."""
+        temp_vault, _ = _class_vault
+        return _read_notes(temp_vault)
+
+    @pytest.fixture
+    def temp_vault_path(self, _class_vault):
+        """Hand out the shared vault copy, restoring what the test changed."""
+        temp_vault, originals = _class_vault
         yield temp_vault
-        shutil.rmtree(temp_dir)
+
+        # Undo the test's writes: drop new files (notes, .bak backups) and
+        # rewrite only the originals whose content changed
+        for path in temp_vault.rglob("*"):
+            if path.is_file() and path.relative_to(temp_vault) not in originals:
+                path.unlink()
+        for relative_path, original_bytes in originals.items():
+            path = temp_vault / relative_path
+            if not path.is_file() or path.read_bytes() != original_bytes:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(original_bytes)
 
     @pytest.fixture
     def config(self):
@@ -105,18 +157,12 @@ class TestAutoLinkGenerationTask74:
         print(f"Files processed: {result.total_files_processed}")
 
     def test_actual_auto_linking_with_limited_scope(
-        self, auto_link_use_case, temp_vault_path
+        self, auto_link_use_case, temp_vault_path, pristine_notes
     ):
         """Test actual auto-linking with limited scope to verify functionality.
 
         Requirements: 2.8 - Generate WikiLinks with appropriate aliases
         """
-        # Store original file contents for comparison
-        original_contents = {}
-        for md_file in temp_vault_path.rglob("*.md"):
-            if md_file.is_file():
-                original_contents[str(md_file)] = md_file.read_text(encoding="utf-8")
-
         # Create request for actual execution with very limited scope
         request = AutoLinkGenerationRequest(
             vault_path=temp_vault_path,
@@ -139,8 +185,8 @@ class TestAutoLinkGenerationTask74:
 
             # Verify that files were actually modified
             modified_files = []
-            for file_path, original_content in original_contents.items():
-                current_content = Path(file_path).read_text(encoding="utf-8")
+            for file_path, original_content in pristine_notes.items():
+                current_content = _slurp(file_path)
                 if current_content != original_content:
                     modified_files.append(file_path)
 
@@ -151,32 +197,29 @@ class TestAutoLinkGenerationTask74:
         print(f"Actual execution: {result.total_links_created} links created")
         print(f"Files with updates: {len(result.file_updates)}")
 
-    def test_content_integrity_verification(self, auto_link_use_case, temp_vault_path):
+    def test_content_integrity_verification(
+        self, auto_link_use_case, temp_vault_path, pristine_notes
+    ):
         """Verify that existing content is not corrupted during auto-linking.
 
         Requirements: 2.1 - Exclude existing WikiLinks, regular links, frontmatter
         """
-        # Read all files and extract critical content that should not be modified
+        # Extract critical content that should not be modified
         protected_content = {}
 
-        for md_file in temp_vault_path.rglob("*.md"):
-            if md_file.is_file():
-                content = md_file.read_text(encoding="utf-8")
-
-                # Extract frontmatter
-                if content.startswith("---"):
-                    end_idx = content.find("---", 3)
-                    if end_idx != -1:
-                        frontmatter = content[: end_idx + 3]
-                        protected_content[str(md_file)] = {
-                            "frontmatter": frontmatter,
-                            "existing_wikilinks": self._extract_existing_wikilinks(
-                                content
-                            ),
-                            "existing_regular_links": (
-                                self._extract_existing_regular_links(content)
-                            ),
-                        }
+        for md_file, content in pristine_notes.items():
+            # Extract frontmatter
+            if content.startswith("---"):
+                end_idx = content.find("---", 3)
+                if end_idx != -1:
+                    frontmatter = content[: end_idx + 3]
+                    protected_content[str(md_file)] = {
+                        "frontmatter": frontmatter,
+                        "existing_wikilinks": self._extract_existing_wikilinks(content),
+                        "existing_regular_links": (
+                            self._extract_existing_regular_links(content)
+                        ),
+                    }
 
         # Execute auto-linking
         request = AutoLinkGenerationRequest(
@@ -191,7 +234,7 @@ class TestAutoLinkGenerationTask74:
         # Verify protected content remains intact
         for file_path, protected in protected_content.items():
             if Path(file_path).exists():
-                current_content = Path(file_path).read_text(encoding="utf-8")
+                current_content = _slurp(Path(file_path))
 
                 # Verify frontmatter is preserved
                 if current_content.startswith("---"):
@@ -202,7 +245,9 @@ class TestAutoLinkGenerationTask74:
                         assert protected["frontmatter"] in current_frontmatter
 
                 # Verify existing WikiLinks are preserved
-                current_wikilinks = self._extract_existing_wikilinks(current_content)
+                current_wikilinks = set(
+                    self._extract_existing_wikilinks(current_content)
+                )
                 for original_link in protected["existing_wikilinks"]:
                     assert original_link in current_wikilinks, (
                         f"Original WikiLink {original_link} was corrupted "
@@ -210,8 +255,8 @@ class TestAutoLinkGenerationTask74:
                     )
 
                 # Verify existing regular links are preserved
-                current_regular_links = self._extract_existing_regular_links(
-                    current_content
+                current_regular_links = set(
+                    self._extract_existing_regular_links(current_content)
                 )
                 for original_link in protected["existing_regular_links"]:
                     assert original_link in current_regular_links, (
@@ -221,69 +266,68 @@ class TestAutoLinkGenerationTask74:
 
         print("Content integrity verification passed")
 
-    def test_rollback_functionality(self, auto_link_use_case, temp_vault_path):
+    def test_rollback_functionality(
+        self, auto_link_use_case, temp_vault_path, pristine_notes
+    ):
         """Test rollback functionality by comparing before/after states.
 
         This simulates rollback by verifying we can restore original state.
         """
-        # Create backup of original state
-        backup_dir = tempfile.mkdtemp()
-        backup_vault = Path(backup_dir) / "backup-vault"
-        shutil.copytree(temp_vault_path, backup_vault)
-
-        try:
-            # Store original file contents
-            original_files = {}
-            for md_file in temp_vault_path.rglob("*.md"):
-                if md_file.is_file():
-                    original_files[str(md_file.relative_to(temp_vault_path))] = (
-                        md_file.read_text(encoding="utf-8")
-                    )
+        # Original file contents, keyed by vault-relative path
+        original_files = {
+            str(md_file.relative_to(temp_vault_path)): content
+            for md_file, content in pristine_notes.items()
+        }
 
-            # Execute auto-linking
-            request = AutoLinkGenerationRequest(
-                vault_path=temp_vault_path,
-                dry_run=False,
-                max_links_per_file=3,
-                max_files_to_process=2,
-            )
+        # Execute auto-linking
+        request = AutoLinkGenerationRequest(
+            vault_path=temp_vault_path,
+            dry_run=False,
+            max_links_per_file=3,
+            max_files_to_process=2,
+        )
 
-            result = auto_link_use_case.execute(request)
+        result = auto_link_use_case.execute(request)
 
-            # Verify changes were made (if any links were created)
-            if result.total_links_created > 0:
-                changes_detected = False
+        # Verify changes were made (if any links were created)
+        if result.total_links_created > 0:
+            changes_detected = False
+            for relative_path, original_content in original_files.items():
+                current_file = temp_vault_path / relative_path
+                if current_file.exists():
+                    current_content = _slurp(current_file)
+                    if current_content != original_content:
+                        changes_detected = True
+                        break
+
+            if changes_detected:
+                # Simulate rollback by rewriting only the notes that changed
+                # and removing notes that did not exist before
+                for md_file in temp_vault_path.rglob("*.md"):
+                    if str(md_file.relative_to(temp_vault_path)) not in original_files:
+                        md_file.unlink()
                 for relative_path, original_content in original_files.items():
                     current_file = temp_vault_path / relative_path
-                    if current_file.exists():
-                        current_content = current_file.read_text(encoding="utf-8")
-                        if current_content != original_content:
-                            changes_detected = True
-                            break
-
-                if changes_detected:
-                    # Simulate rollback by restoring from backup
-                    shutil.rmtree(temp_vault_path)
-                    shutil.copytree(backup_vault, temp_vault_path)
-
-                    # Verify rollback was successful
-                    for relative_path, original_content in original_files.items():
-                        restored_file = temp_vault_path / relative_path
-                        assert restored_file.exists()
-                        restored_content = restored_file.read_text(encoding="utf-8")
-                        assert restored_content == original_content, (
-                            f"Rollback failed for {relative_path}"
-                        )
-
-                    print("Rollback functionality verified successfully")
-                else:
-                    print("No changes were made, rollback test not applicable")
-            else:
-                print("No links created, rollback test not applicable")
+                    if (
+                        not current_file.exists()
+                        or _slurp(current_file) != original_content
+                    ):
+                        current_file.write_bytes(original_content.encode("utf-8"))
 
-        finally:
-            # Cleanup backup
-            shutil.rmtree(backup_dir)
+                # Verify rollback was successful
+                for relative_path, original_content in original_files.items():
+                    restored_file = temp_vault_path / relative_path
+                    assert restored_file.exists()
+                    restored_content = _slurp(restored_file)
+                    assert restored_content == original_content, (
+                        f"Rollback failed for {relative_path}"
+                    )
+
+                print("Rollback functionality verified successfully")
+            else:
+                print("No changes were made, rollback test not applicable")
+        else:
+            print("No links created, rollback test not applicable")
 
     def test_bidirectional_alias_updates(self, auto_link_use_case, temp_vault_path):
         """Test that aliases are properly added to target files.
@@ -343,15 +387,11 @@ class TestAutoLinkGenerationTask74:
 
     def _extract_existing_wikilinks(self, content: str) -> list[str]:
         """Extract existing WikiLinks from content."""
-
-        pattern = r"\[\[([^\]]+)\]\]"
-        return re.findall(pattern, content)
+        return WIKILINK_RE.findall(content)
 
     def _extract_existing_regular_links(self, content: str) -> list[str]:
         """Extract existing regular markdown links from content."""
-
-        pattern = r"\[([^\]]+)\]\(([^)]+)\)"
-        return [f"[{text}]({url})" for text, url in re.findall(pattern, content)]
+        return [f"[{text}]({url})" for text, url in MARKDOWN_LINK_RE.findall(content)]
 
     def test_performance_with_larger_scope(self, auto_link_use_case, temp_vault_path):
         """Test performance characteristics with larger scope."""
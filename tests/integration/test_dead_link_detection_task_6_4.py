@@ -18,6 +18,7 @@ from pathlib import Path
 import pytest
 
 
+@pytest.mark.slow
 class TestDeadLinkDetectionRealData:
     """Integration tests for dead link detection with real vault data."""
 
@@ -1,6 +1,5 @@
 """Integration tests for LLM configuration system."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -21,18 +20,12 @@ from knowledge_base_organizer.infrastructure.llm_factory import (
 class TestLLMConfigurationIntegration:
     """Integration tests for LLM configuration system."""
 
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        # Create temporary config file
-        self.temp_dir = Path(tempfile.mkdtemp())
+    @pytest.fixture(autouse=True)
+    def _temp_config(self, tmp_path: Path) -> None:
+        """Set up test environment; pytest removes tmp_path afterwards."""
+        self.temp_dir = tmp_path
         self.config_file = self.temp_dir / "test_llm_config.yaml"
 
-    def teardown_method(self) -> None:
-        """Clean up test environment."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
     def test_end_to_end_ollama_configuration(self) -> None:
         """Test end-to-end Ollama configuration and service creation."""
         # Create Ollama configuration
@@ -231,6 +231,22 @@ This document discusses Interface Design.  # This should be found
         assert len(interface_candidates) == 1
         assert interface_candidates[0].position.line_number > 5  # Not in frontmatter
 
+    def test_find_link_candidates_reuses_target_lookup(
+        self, service, file_registry, mocker
+    ):
+        """Test that the target lookup is rebuilt only when targets change."""
+        build = mocker.spy(service, "_build_enhanced_target_lookup")
+        content = "This document discusses Interface Design."
+
+        service.find_link_candidates(content, file_registry)
+        service.find_link_candidates(content, dict(file_registry))
+        assert build.call_count == 1
+
+        file_registry["20230101120000"].frontmatter.aliases.append("UX Design")
+        candidates = service.find_link_candidates("We need UX Design.", file_registry)
+        assert build.call_count == 2
+        assert [c.text for c in candidates] == ["UX Design"]
+
     def test_detect_dead_links(self, service):
         """Test detection of dead links."""
         # Create a file with dead links